@@ -14,7 +14,6 @@ from kicad_jlcimport.easyeda.api import (
     search_components,
     validate_lcsc_id,
 )
-from kicad_jlcimport.importer import import_component
 from kicad_jlcimport.kicad.library import get_global_lib_dir, load_config
 from kicad_jlcimport.kicad.version import DEFAULT_KICAD_VERSION, SUPPORTED_VERSIONS
 
@@ -100,6 +99,10 @@ def _resolve_project_dir(path: str) -> str:
 
 def cmd_import(args):
     """Import a component and show/save the output."""
+    # Deferred: the parser and writers are only needed for imports, so
+    # `search` and `--help` don't pay for loading them
+    from kicad_jlcimport.importer import import_component
+
     try:
         lcsc_id = validate_lcsc_id(args.part)
     except ValueError as e:
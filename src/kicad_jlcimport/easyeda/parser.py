@@ -167,40 +167,15 @@ def parse_symbol_shapes(shapes: List[str], origin_x: float, origin_y: float) ->
     sym = EESymbol()
 
     for shape_str in shapes:
-        # Symbols use ^^ as sub-delimiter within pin shapes
-        if shape_str.startswith("P~"):
-            pin = _parse_pin(shape_str, origin_x, origin_y)
-            if pin:
-                sym.pins.append(pin)
-        elif shape_str.startswith("R~"):
-            rect = _parse_sym_rect(shape_str, origin_x, origin_y)
-            if rect:
-                sym.rectangles.append(rect)
-        elif shape_str.startswith("E~"):
-            circle = _parse_sym_circle(shape_str, origin_x, origin_y)
-            if circle:
-                sym.circles.append(circle)
-        elif shape_str.startswith("PL~") or shape_str.startswith("PG~"):
-            poly = _parse_sym_polyline(shape_str, origin_x, origin_y)
-            if poly:
-                sym.polylines.append(poly)
-        elif shape_str.startswith("A~"):
-            arc = _parse_sym_arc(shape_str, origin_x, origin_y)
-            if arc:
-                sym.arcs.append(arc)
-        elif shape_str.startswith("PT~"):
-            path = _parse_sym_path(shape_str, origin_x, origin_y)
-            if path:
-                sym.polylines.append(path)
-        elif shape_str.startswith("C~"):
-            # C~ is circle (different from E~ ellipse in some versions)
-            circle = _parse_sym_circle_c(shape_str, origin_x, origin_y)
-            if circle:
-                sym.circles.append(circle)
-        elif shape_str.startswith("T~"):
-            text = _parse_sym_text(shape_str, origin_x, origin_y)
-            if text:
-                sym.texts.append(text)
+        # Dispatch on the type prefix before the first "~" (pins use ^^ as a
+        # sub-delimiter, so the prefix is still the leading token)
+        entry = _SYMBOL_SHAPE_PARSERS.get(shape_str.partition("~")[0])
+        if entry is None:
+            continue
+        parse, attr = entry
+        shape = parse(shape_str, origin_x, origin_y)
+        if shape:
+            getattr(sym, attr).append(shape)
 
     return sym
 
@@ -922,6 +897,21 @@ def _parse_sym_arc(shape_str: str, origin_x: float, origin_y: float) -> EEArc:
     )
 
 
+# Symbol shape type prefix -> (parser, EESymbol list the result is appended to).
+# C~ is a circle, distinct from the E~ ellipse used by some EasyEDA versions.
+_SYMBOL_SHAPE_PARSERS = {
+    "P": (_parse_pin, "pins"),
+    "R": (_parse_sym_rect, "rectangles"),
+    "E": (_parse_sym_circle, "circles"),
+    "PL": (_parse_sym_polyline, "polylines"),
+    "PG": (_parse_sym_polyline, "polylines"),
+    "A": (_parse_sym_arc, "arcs"),
+    "PT": (_parse_sym_path, "polylines"),
+    "C": (_parse_sym_circle_c, "circles"),
+    "T": (_parse_sym_text, "texts"),
+}
+
+
 def compute_arc_midpoint(
     start: Tuple[float, float], end: Tuple[float, float], rx: float, ry: float, large_arc: int, sweep: int
 ) -> Tuple[float, float]:
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import mmap
 import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable
 
 from .easyeda.api import download_step, download_wrl_source, fetch_full_component
@@ -51,25 +54,70 @@ def _build_keywords(comp: dict) -> str:
     return " ".join(sorted(terms))
 
 
+# STEP and WRL sources come from different EasyEDA endpoints; fetching them
+# on separate threads overlaps the two TLS round-trips with each other and
+# with the symbol parsing.
+_DOWNLOAD_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jlcimport-3d")
+
+_SYMBOL_NAME_RE = re.compile(rb'\(symbol "([^"]*)"')
+
+# sym_path -> ((st_mtime_ns, st_size), symbol names) so batch imports into the
+# same library parse it once instead of once per component.
+_SYMLIB_NAMES_CACHE: dict[str, tuple[tuple[int, int], frozenset[str]]] = {}
+
+
+def _symbol_names(sym_path: str) -> frozenset[str]:
+    """Return the names of all ``(symbol "...")`` blocks in a .kicad_sym file.
+
+    The library is memory-mapped and scanned as bytes. Results are cached
+    per path and reused until the file's mtime or size changes.
+    """
+    with open(sym_path, "rb") as f:
+        st = os.fstat(f.fileno())
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _SYMLIB_NAMES_CACHE.get(sym_path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        if st.st_size == 0:
+            names = frozenset()  # mmap cannot map an empty file
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                names = frozenset(m.decode("utf-8", "replace") for m in _SYMBOL_NAME_RE.findall(mm))
+    _SYMLIB_NAMES_CACHE[sym_path] = (key, names)
+    return names
+
+
+def _symbol_in_lib(sym_path: str, name: str) -> bool:
+    """Return True if the .kicad_sym at *sym_path* defines symbol *name*."""
+    return name in _symbol_names(sym_path)
+
+
 def _check_existing_files(lib_dir: str, lib_name: str, name: str) -> list[str]:
     """Return a list of existing file types (e.g. ["footprint", "symbol", "3D model"])."""
     existing: list[str] = []
-    fp_path = os.path.join(lib_dir, f"{lib_name}.pretty", f"{name}.kicad_mod")
-    if os.path.exists(fp_path):
-        existing.append("footprint")
-    sym_path = os.path.join(lib_dir, f"{lib_name}.kicad_sym")
-    if os.path.exists(sym_path):
+    # One directory read tells us which library parts exist at all; only
+    # those are probed further. The .pretty/.3dshapes dirs themselves can
+    # hold thousands of files, so they get targeted stats rather than scans.
+    try:
+        with os.scandir(lib_dir) as it:
+            entries = {e.name for e in it}
+    except OSError:
+        return existing
+    if f"{lib_name}.pretty" in entries:
+        if os.path.exists(os.path.join(lib_dir, f"{lib_name}.pretty", f"{name}.kicad_mod")):
+            existing.append("footprint")
+    if f"{lib_name}.kicad_sym" in entries:
         try:
-            with open(sym_path, encoding="utf-8") as f:
-                if f'(symbol "{name}"' in f.read():
-                    existing.append("symbol")
-        except (PermissionError, OSError):
+            if _symbol_in_lib(os.path.join(lib_dir, f"{lib_name}.kicad_sym"), name):
+                existing.append("symbol")
+        except (PermissionError, OSError, ValueError):
             pass
-    models_dir = os.path.join(lib_dir, f"{lib_name}.3dshapes")
-    step_path = os.path.join(models_dir, f"{name}.step")
-    wrl_path = os.path.join(models_dir, f"{name}.wrl")
-    if os.path.exists(step_path) or os.path.exists(wrl_path):
-        existing.append("3D model")
+    if f"{lib_name}.3dshapes" in entries:
+        models_dir = os.path.join(lib_dir, f"{lib_name}.3dshapes")
+        step_path = os.path.join(models_dir, f"{name}.step")
+        wrl_path = os.path.join(models_dir, f"{name}.wrl")
+        if os.path.exists(step_path) or os.path.exists(wrl_path):
+            existing.append("3D model")
     return existing
 
 
@@ -163,12 +211,13 @@ def import_component(
         uuid_3d = footprint.model.uuid
     if not uuid_3d:
         uuid_3d = comp.get("uuid_3d", "")
+    step_future = None
+    wrl_future = None
     if uuid_3d:
-        wrl_source = download_wrl_source(uuid_3d)
-    if footprint.model:
-        model_offset, model_rotation = compute_model_transform(
-            footprint.model, comp["fp_origin_x"], comp["fp_origin_y"], wrl_source
-        )
+        step_dest = os.path.join(lib_dir, f"{lib_name}.3dshapes", f"{name}.step")
+        if export_only or overwrite or not os.path.exists(step_dest):
+            step_future = _DOWNLOAD_POOL.submit(download_step, uuid_3d)
+        wrl_future = _DOWNLOAD_POOL.submit(download_wrl_source, uuid_3d)
 
     # Parse symbol
     sym_content = ""
@@ -195,6 +244,14 @@ def import_component(
     else:
         log("No symbol data available")
 
+    # The model transform needs the WRL geometry, which downloaded meanwhile
+    if wrl_future is not None:
+        wrl_source = wrl_future.result()
+    if footprint.model:
+        model_offset, model_rotation = compute_model_transform(
+            footprint.model, comp["fp_origin_x"], comp["fp_origin_y"], wrl_source
+        )
+
     if export_only:
         return _export_only(
             lib_dir,
@@ -212,6 +269,7 @@ def import_component(
             kicad_version,
             wrl_source,
             metadata,
+            step_future,
         )
 
     return _import_to_library(
@@ -232,6 +290,7 @@ def import_component(
         kicad_version,
         wrl_source,
         metadata,
+        step_future,
     )
 
 
@@ -251,6 +310,7 @@ def _export_only(
     kicad_version,
     wrl_source=None,
     metadata=None,
+    step_future: Future | None = None,
 ):
     """Write raw .kicad_mod, .kicad_sym, and 3D models to a flat directory."""
     os.makedirs(out_dir, exist_ok=True)
@@ -291,7 +351,7 @@ def _export_only(
 
     if uuid_3d:
         models_dir = os.path.join(out_dir, "3dmodels")
-        step_data = download_step(uuid_3d)
+        step_data = step_future.result() if step_future else download_step(uuid_3d)
         if wrl_source is None:
             wrl_source = download_wrl_source(uuid_3d)
         step_path, wrl_path = save_models(models_dir, name, step_data, wrl_source)
@@ -321,6 +381,7 @@ def _import_to_library(
     kicad_version,
     wrl_source=None,
     metadata=None,
+    step_future: Future | None = None,
 ):
     """Import into KiCad library structure with lib-table updates."""
     log(f"Destination: {lib_dir}")
@@ -336,7 +397,9 @@ def _import_to_library(
         wrl_existed = os.path.exists(wrl_dest)
 
         log("Downloading 3D model...")
-        step_data = download_step(uuid_3d) if overwrite or not step_existed else None
+        step_data = None
+        if overwrite or not step_existed:
+            step_data = step_future.result() if step_future else download_step(uuid_3d)
         if wrl_source is None and (overwrite or not wrl_existed):
             wrl_source = download_wrl_source(uuid_3d)
         step_path, wrl_path = save_models(paths["models_dir"], name, step_data, wrl_source)
@@ -383,6 +446,7 @@ def _import_to_library(
     # Write symbol
     if sym_content:
         sym_added = add_symbol_to_lib(paths["sym_path"], name, sym_content, overwrite, kicad_version=kicad_version)
+        _SYMLIB_NAMES_CACHE.pop(paths["sym_path"], None)
         if sym_added:
             log(f"  Symbol added: {paths['sym_path']}")
         else:
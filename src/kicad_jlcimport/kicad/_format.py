@@ -2,6 +2,10 @@
 
 import math
 import uuid as _uuid_mod
+from functools import lru_cache
+
+# Characters that escape_sexpr rewrites; most strings contain none of them
+_SEXPR_SPECIAL = frozenset('\\"\n')
 
 
 def gen_uuid() -> str:
@@ -9,19 +13,25 @@ def gen_uuid() -> str:
     return str(_uuid_mod.uuid4())
 
 
+@lru_cache(maxsize=8192)
 def fmt_float(v: float) -> str:
     """Format a float for KiCad S-expression output.
 
     Returns integers without decimals, otherwise up to 6 decimal places
     with trailing zeros stripped. NaN/Inf values are clamped to 0.
+    Results are memoized: pad grids and pin pitches repeat the same
+    coordinates many times per file.
     """
-    if math.isnan(v) or math.isinf(v):
+    if not math.isfinite(v):
         return "0"
-    if v == int(v) and abs(v) < 1e10:
-        return str(int(v))
-    return f"{v:.6f}".rstrip("0").rstrip(".")
+    # Whole numbers fall out of the same spec: "5.000000" strips to "5"
+    text = f"{v:.6f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
 
 
+@lru_cache(maxsize=8192)
 def escape_sexpr(s: str) -> str:
     """Escape special characters for S-expression string values."""
+    if _SEXPR_SPECIAL.isdisjoint(s):
+        return s
     return s.replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
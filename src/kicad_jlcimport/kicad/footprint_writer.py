@@ -128,10 +128,10 @@ def write_footprint(
     # Pads
     for pad in footprint.pads:
         pad_type, pad_shape, layers = _pad_type_info(pad)
-        at_str = f"(at {_fmt(pad.x)} {_fmt(pad.y)}"
+        at_parts = ["(at", _fmt(pad.x), _fmt(pad.y)]
         if pad.rotation != 0:
-            at_str += f" {_fmt(pad.rotation)}"
-        at_str += ")"
+            at_parts.append(_fmt(pad.rotation))
+        at_str = " ".join(at_parts) + ")"
 
         size_str = f"(size {_fmt(pad.width)} {_fmt(pad.height)})"
         layers_str = " ".join(f'"{layer}"' for layer in layers)
@@ -151,11 +151,11 @@ def write_footprint(
             lines.append(f"      (gr_poly (pts {pts_str}) (width 0) (fill yes))")
             lines.append(f'    ) (uuid "{_uuid()}"))')
         else:
-            pad_line = f'  (pad "{pad.number}" {pad_type} {pad_shape} {at_str} {size_str}'
+            pad_parts = [f'  (pad "{pad.number}" {pad_type} {pad_shape} {at_str} {size_str}']
             if pad.drill > 0:
-                pad_line += f" (drill {_fmt(pad.drill)})"
-            pad_line += f' (layers {layers_str}) (uuid "{_uuid()}"))'
-            lines.append(pad_line)
+                pad_parts.append(f"(drill {_fmt(pad.drill)})")
+            pad_parts.append(f'(layers {layers_str}) (uuid "{_uuid()}"))')
+            lines.append(" ".join(pad_parts))
 
     # Holes (NPTH)
     for hole in footprint.holes:
@@ -199,9 +199,10 @@ def write_symbol(
     for pin in symbol.pins:
         elec_type = pin.electrical_type
         # Direction is encoded in the angle field of (at x y angle)
-        pin_line = f"      (pin {elec_type} line (at {_fmt(pin.x)} {_fmt(pin.y)} {_fmt(pin.rotation)})"
-        pin_line += f" (length {_fmt(pin.length)})"
-        lines.append(pin_line)
+        lines.append(
+            f"      (pin {elec_type} line (at {_fmt(pin.x)} {_fmt(pin.y)} {_fmt(pin.rotation)})"
+            f" (length {_fmt(pin.length)})"
+        )
 
         name_effects = "(effects (font (size 1.27 1.27)))"
         if not pin.name_visible:
@@ -6,8 +6,11 @@ import argparse
 import os
 import sys
 
+from kicad_jlcimport.easyeda import api
+
 
 def main():
+    # Imported here so importing the package does not load Textual
     from .app import JLCImportTUI
 
     parser = argparse.ArgumentParser(
@@ -40,8 +43,6 @@ def main():
     args = parser.parse_args()
 
     if args.insecure:
-        from kicad_jlcimport.easyeda import api
-
         api.allow_unverified_ssl()
 
     project_dir = args.project
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import mmap
 import os
 import re
 import threading
 import traceback
 import webbrowser
+from operator import itemgetter
 
+from PIL import Image as PILImage
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -34,7 +37,6 @@ from kicad_jlcimport.easyeda import api
 from kicad_jlcimport.easyeda.api import (
     APIError,
     SSLCertError,
-    fetch_product_image,
     filter_by_min_stock,
     filter_by_type,
     search_components,
@@ -48,7 +50,45 @@ from kicad_jlcimport.kicad.library import (
 from kicad_jlcimport.kicad.version import DEFAULT_KICAD_VERSION, SUPPORTED_VERSIONS
 
 from .gallery import GalleryScreen
-from .helpers import TIImage, make_no_image, make_skeleton_frame, pil_from_bytes
+from .helpers import (
+    TIImage,
+    decode_product_image,
+    fetch_product_image_cached,
+    get_decoded_image,
+    make_no_image,
+    make_skeleton_frame,
+)
+
+# Start of the LCSC id property the symbol writer adds to every imported symbol
+_LCSC_PROPERTY_PREFIX = b'(property "LCSC" "'
+
+
+def _annotate_row(r: dict) -> None:
+    """Add display strings and sort keys to a search result, in place.
+
+    The results table, detail pane and gallery all show the price and stock
+    strings, so they are formatted once per search instead of on every
+    repopulate and cursor move; the sort keys let _SORT_KEYS use itemgetter.
+    """
+    r["_price_str"] = f"${r['price']:.4f}" if r["price"] else "N/A"
+    r["_stock_str"] = f"{r['stock']:,}" if r["stock"] else "N/A"
+    r["_price_sort"] = r["price"] or 0
+    r["_stock_sort"] = r["stock"] or 0
+    r["_model_sort"] = (r.get("model") or "").lower()
+    r["_package_sort"] = (r.get("package") or "").lower()
+    r["_description_sort"] = (r.get("description") or "").lower()
+
+
+# Results table column index -> sort key over annotated search results
+_SORT_KEYS = {
+    0: itemgetter("lcsc"),
+    1: itemgetter("type"),
+    2: itemgetter("_price_sort"),
+    3: itemgetter("_stock_sort"),
+    4: itemgetter("_model_sort"),
+    5: itemgetter("_package_sort"),
+    6: itemgetter("_description_sort"),
+}
 
 
 class SSLWarningScreen(Screen):
@@ -482,8 +522,15 @@ class JLCImportTUI(App):
         self._sort_col: int = -1
         self._sort_ascending: bool = True
         self._imported_ids: set = set()
+        # Library path -> (mtime_ns, size, ids) from its last scan
+        self._imported_ids_cache: dict[str, tuple[int, int, frozenset]] = {}
         self._selected_index: int = -1
         self._image_request_id: int = 0
+        # Newest detail image request and whether a fetch loop is running;
+        # both guarded by _detail_image_lock (see _request_detail_image).
+        self._detail_image_next: tuple[str, int] | None = None
+        self._detail_image_busy: bool = False
+        self._detail_image_lock = threading.Lock()
         self._skeleton_timer = None
         self._skeleton_phase: int = 0
         self._datasheet_url: str = ""
@@ -597,6 +644,10 @@ class JLCImportTUI(App):
         log = self.query_one("#status-log", RichLog)
         log.write(msg)
 
+    def _log_from_thread(self, msg: str):
+        """Write a message to the status log from a worker thread."""
+        self.app.call_from_thread(self._log, msg)
+
     def _handle_ssl_cert_error(self):
         """Handle an SSLCertError from a worker thread.
 
@@ -678,9 +729,12 @@ class JLCImportTUI(App):
     def _deselect_search(self, pos: int):
         """Move cursor to end without selection after a brief delay."""
         search_input = self.query_one("#search-input", Input)
-        from textual.widgets._input import Selection
-
-        search_input.selection = Selection(pos, pos)
+        try:
+            from textual.widgets.input import Selection
+        except ImportError:  # Textual without Input selection support
+            pass
+        else:
+            search_input.selection = Selection(pos, pos)
         search_input.cursor_position = pos
 
     def _hide_suggestions(self):
@@ -885,7 +939,7 @@ class JLCImportTUI(App):
         if not keyword:
             return
 
-        self.app.call_from_thread(self._log, f'Searching for "{keyword}"...')
+        self._log_from_thread(f'Searching for "{keyword}"...')
         self.app.call_from_thread(self._start_search_pulse)
 
         try:
@@ -896,8 +950,10 @@ class JLCImportTUI(App):
                 result = search_components(keyword, page_size=500)
 
             results = result["results"]
+            for r in results:
+                _annotate_row(r)
 
-            results.sort(key=lambda r: r["stock"] or 0, reverse=True)
+            results.sort(key=_SORT_KEYS[3], reverse=True)
 
             self._raw_search_results = results
             self._sort_col = 3  # sorted by stock
@@ -915,9 +971,9 @@ class JLCImportTUI(App):
             self.app.call_from_thread(self._repopulate_results)
 
         except APIError as e:
-            self.app.call_from_thread(self._log, f"[red]Search error: {e}[/red]")
+            self._log_from_thread(f"[red]Search error: {e}[/red]")
         except Exception as e:
-            self.app.call_from_thread(self._log, f"[red]Error: {type(e).__name__}: {e}[/red]")
+            self._log_from_thread(f"[red]Error: {type(e).__name__}: {e}[/red]")
         finally:
             self.app.call_from_thread(self._stop_search_pulse)
 
@@ -982,8 +1038,6 @@ class JLCImportTUI(App):
 
     def _refresh_imported_ids(self):
         """Scan the symbol library for the currently selected destination."""
-        import re as _re
-
         self._imported_ids = set()
         lib_name = self._lib_name
         use_global = self.query_one("#dest-global", RadioButton).value
@@ -995,12 +1049,38 @@ class JLCImportTUI(App):
             return
         p = os.path.join(lib_dir, f"{lib_name}.kicad_sym")
         try:
-            if os.path.exists(p):
-                with open(p, encoding="utf-8") as f:
-                    for match in _re.finditer(r'\(property "LCSC" "(C\d+)"', f.read()):
-                        self._imported_ids.add(match.group(1))
-        except (PermissionError, OSError):
+            st = os.stat(p)
+        except OSError:
+            return
+        # Unchanged since the last scan (the usual case between imports)
+        cached = self._imported_ids_cache.get(p)
+        if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+            self._imported_ids = set(cached[2])
+            return
+        try:
+            # Scan the mapped bytes directly instead of decoding the whole library
+            with open(p, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Fixed literal, so a plain substring search is enough
+                i = mm.find(_LCSC_PROPERTY_PREFIX)
+                while i >= 0:
+                    i += len(_LCSC_PROPERTY_PREFIX)
+                    end = mm.find(b'"', i)
+                    if end < 0:
+                        break
+                    val = mm[i:end]
+                    # Same ids the old (C\d+) pattern accepted
+                    if val[:1] == b"C" and val[1:].isdigit():
+                        self._imported_ids.add(val.decode("ascii"))
+                    i = mm.find(_LCSC_PROPERTY_PREFIX, end)
+        except (OSError, ValueError):  # ValueError: mmap of an empty file
             pass
+        self._imported_ids_cache[p] = (st.st_mtime_ns, st.st_size, frozenset(self._imported_ids))
+
+    def _mark_imported(self, lcsc_id: str, use_global: bool):
+        """Record a just-imported part without rescanning the symbol library."""
+        # Only if the destination shown is still the one the part went to
+        if self.query_one("#dest-global", RadioButton).value == use_global:
+            self._imported_ids.add(lcsc_id)
 
     def _repopulate_results(self):
         """Repopulate the DataTable from search results."""
@@ -1012,13 +1092,11 @@ class JLCImportTUI(App):
             if self._selected_result and lcsc == self._selected_result["lcsc"]:
                 reselect_idx = i
             prefix = "\u2713 " if lcsc in self._imported_ids else ""
-            price_str = f"${r['price']:.4f}" if r["price"] else "N/A"
-            stock_str = f"{r['stock']:,}" if r["stock"] else "N/A"
             table.add_row(
                 prefix + lcsc,
                 r["type"],
-                price_str,
-                stock_str,
+                r["_price_str"],
+                r["_stock_str"],
                 r["model"],
                 r.get("package", ""),
                 r.get("description", ""),
@@ -1056,20 +1134,29 @@ class JLCImportTUI(App):
             self._sort_col = col_idx
             self._sort_ascending = col_idx not in (2, 3)
 
-        key_map = {
-            0: lambda r: r.get("lcsc", ""),
-            1: lambda r: r.get("type", ""),
-            2: lambda r: r.get("price") or 0,
-            3: lambda r: r.get("stock") or 0,
-            4: lambda r: r.get("model", "").lower(),
-            5: lambda r: r.get("package", "").lower(),
-            6: lambda r: r.get("description", "").lower(),
-        }
-        key_fn = key_map.get(col_idx)
+        key_fn = _SORT_KEYS.get(col_idx)
         if key_fn:
             self._search_results.sort(key=key_fn, reverse=not self._sort_ascending)
             self._update_sort_indicators()
-            self._repopulate_results()
+            self._reorder_results()
+
+    def _reorder_results(self):
+        """Reorder the existing table rows to match _search_results.
+
+        The rows already hold the same results, so sorting reorders them in
+        place instead of clearing the table and adding every row again.
+        """
+        table = self.query_one("#results-table", DataTable)
+        order = {r["lcsc"]: i for i, r in enumerate(self._search_results)}
+        lcsc_col = next(iter(table.columns))
+        # The LCSC cell may carry the imported check mark in front of the id
+        table.sort(lcsc_col, key=lambda cell: order.get(cell.rsplit(" ", 1)[-1], 0))
+        if self._selected_result:
+            for i, r in enumerate(self._search_results):
+                if r["lcsc"] == self._selected_result["lcsc"]:
+                    self._selected_index = i
+                    table.move_cursor(row=i)
+                    break
 
     def _update_sort_indicators(self):
         """Update column headers with sort direction arrows."""
@@ -1129,10 +1216,8 @@ class JLCImportTUI(App):
         self.query_one("#detail-lcsc", Label).update(f"LCSC [b]{r['lcsc']}[/b]  ({r['type']})")
         self.query_one("#detail-brand", Label).update(f"Brand [b]{r['brand']}[/b]")
         self.query_one("#detail-package", Label).update(f"Package [b]{r['package']}[/b]")
-        price_str = f"${r['price']:.4f}" if r["price"] else "N/A"
-        stock_str = f"{r['stock']:,}" if r["stock"] else "N/A"
-        self.query_one("#detail-price", Label).update(f"Price [b]{price_str}[/b]")
-        self.query_one("#detail-stock", Label).update(f"Stock [b]{stock_str}[/b]")
+        self.query_one("#detail-price", Label).update(f"Price [b]{r['_price_str']}[/b]")
+        self.query_one("#detail-stock", Label).update(f"Stock [b]{r['_stock_str']}[/b]")
         self.query_one("#detail-desc", Label).update(r.get("description", ""))
 
         # URLs
@@ -1146,33 +1231,69 @@ class JLCImportTUI(App):
         self._image_request_id += 1
         request_id = self._image_request_id
         lcsc_url = r.get("url", "")
-        if lcsc_url:
+        img = get_decoded_image(lcsc_url)
+        if img is not None:
+            self._set_detail_image(img, request_id)
+        elif lcsc_url:
             self._start_skeleton()
-            self._fetch_detail_image(lcsc_url, request_id)
+            self._request_detail_image(lcsc_url, request_id)
         else:
             self._stop_skeleton()
             self.query_one("#detail-image", TIImage).image = make_no_image(100, 100)
 
+    def _request_detail_image(self, lcsc_url: str, request_id: int):
+        """Queue a detail image fetch, replacing any request not yet started.
+
+        At most one download runs at a time. While the cursor moves quickly
+        through the results, rows passed over before the running download
+        finishes are never fetched; only the newest pending row is.
+        """
+        with self._detail_image_lock:
+            self._detail_image_next = (lcsc_url, request_id)
+            if self._detail_image_busy:
+                return
+            self._detail_image_busy = True
+        self._fetch_detail_images()
+
     @work(thread=True)
-    def _fetch_detail_image(self, lcsc_url: str, request_id: int):
-        """Fetch product image in background."""
-        img_data = None
+    def _fetch_detail_images(self):
+        """Fetch queued product images in background until none is pending."""
         try:
-            try:
-                img_data = fetch_product_image(lcsc_url)
-            except SSLCertError:
-                self._handle_ssl_cert_error()
-                img_data = fetch_product_image(lcsc_url)
-        except Exception:
-            pass
-        self.call_from_thread(self._set_detail_image, img_data, request_id)
-
-    def _set_detail_image(self, img_data: bytes | None, request_id: int):
+            while True:
+                with self._detail_image_lock:
+                    job = self._detail_image_next
+                    self._detail_image_next = None
+                    if job is None:
+                        self._detail_image_busy = False
+                        return
+                lcsc_url, request_id = job
+                if request_id != self._image_request_id:
+                    continue  # detail was cleared or moved on meanwhile
+                img_data = None
+                try:
+                    try:
+                        img_data = fetch_product_image_cached(lcsc_url)
+                    except SSLCertError:
+                        self._handle_ssl_cert_error()
+                        img_data = fetch_product_image_cached(lcsc_url)
+                except Exception:
+                    pass
+                if request_id != self._image_request_id:
+                    continue  # moved on during the download; keep the bytes, skip the decode
+                # Decode here so the UI thread only has to display the image
+                img = decode_product_image(lcsc_url, img_data)
+                self.call_from_thread(self._set_detail_image, img, request_id)
+        except BaseException:
+            # Don't leave the queue marked busy, or no later fetch would start
+            with self._detail_image_lock:
+                self._detail_image_busy = False
+            raise
+
+    def _set_detail_image(self, img: PILImage.Image | None, request_id: int):
         """Set the detail image (called on main thread)."""
         if self._image_request_id != request_id:
             return
         self._stop_skeleton()
-        img = pil_from_bytes(img_data)
         if img is None:
             img = make_no_image(100, 100)
         self.query_one("#detail-image", TIImage).image = img
@@ -1244,11 +1365,7 @@ class JLCImportTUI(App):
             result_holder.append(confirmed)
             event.set()
 
-        from textual.screen import Screen as _Screen
-        from textual.widgets import Button as _Button
-        from textual.widgets import Static as _Static
-
-        class _ConfirmScreen(_Screen):
+        class _ConfirmScreen(Screen):
             CSS = """
             _ConfirmScreen {
                 align: center middle;
@@ -1269,12 +1386,12 @@ class JLCImportTUI(App):
 
             def compose(self_screen):
                 with Vertical(id="confirm-dialog"):
-                    yield _Static(msg, id="confirm-msg")
+                    yield Static(msg, id="confirm-msg")
                     with Horizontal(id="confirm-buttons"):
-                        yield _Button("Yes", id="confirm-yes", variant="warning")
-                        yield _Button("No", id="confirm-no")
+                        yield Button("Yes", id="confirm-yes", variant="warning")
+                        yield Button("No", id="confirm-no")
 
-            def on_button_pressed(self_screen, btn_event: _Button.Pressed):
+            def on_button_pressed(self_screen, btn_event: Button.Pressed):
                 self_screen.dismiss(btn_event.button.id == "confirm-yes")
 
         self.app.call_from_thread(self.push_screen, _ConfirmScreen(), _on_dismiss)
@@ -1291,19 +1408,17 @@ class JLCImportTUI(App):
                 self._handle_ssl_cert_error()
                 self._do_import(lcsc_id, lib_dir, use_global, kicad_version, search_result)
         except APIError as e:
-            self.app.call_from_thread(self._log, f"[red]API Error: {e}[/red]")
+            self._log_from_thread(f"[red]API Error: {e}[/red]")
         except Exception as e:
-            self.app.call_from_thread(self._log, f"[red]Error: {e}[/red]")
-            self.app.call_from_thread(self._log, traceback.format_exc())
+            self._log_from_thread(f"[red]Error: {e}[/red]")
+            self._log_from_thread(traceback.format_exc())
         finally:
             self.app.call_from_thread(self.query_one("#detail-import-btn", Button).__setattr__, "disabled", False)
 
     def _do_import(self, lcsc_id: str, lib_dir: str, use_global: bool, kicad_version: int, search_result=None):
         """Execute the import process."""
         lib_name = self._lib_name
-
-        def log(msg):
-            self.app.call_from_thread(self._log, msg)
+        log = self._log_from_thread
 
         result = import_component(
             lcsc_id,
@@ -1326,5 +1441,5 @@ class JLCImportTUI(App):
         name = result["name"]
         log(f"\n[green bold]Done! '{title}' imported as {lib_name}:{name}[/green bold]")
         self.app.call_from_thread(self._persist_destination, use_global)
-        self.app.call_from_thread(self._refresh_imported_ids)
+        self.app.call_from_thread(self._mark_imported, lcsc_id, use_global)
         self.app.call_from_thread(self._repopulate_results)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from PIL import Image as PILImage
 from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -10,9 +11,17 @@ from textual.screen import Screen
 from textual.widgets import Button, Label
 from textual_image.widget import HalfcellImage
 
-from kicad_jlcimport.easyeda.api import SSLCertError, allow_unverified_ssl, fetch_product_image
+from kicad_jlcimport.easyeda.api import SSLCertError, allow_unverified_ssl
 
-from .helpers import TIImage, make_no_image, make_skeleton_frame, pil_from_bytes
+from .helpers import (
+    TIImage,
+    decode_product_image,
+    fetch_product_image_cached,
+    get_cached_image,
+    get_decoded_image,
+    make_no_image,
+    make_skeleton_frame,
+)
 
 
 class GalleryScreen(Screen):
@@ -81,7 +90,8 @@ class GalleryScreen(Screen):
         super().__init__()
         self._results = results
         self._index = index
-        self._image_cache: dict[int, bytes | None] = {}
+        self._no_image: set[int] = set()  # indices whose fetch found no image
+        self._in_flight: set[int] = set()
         self._skeleton_timer = None
         self._skeleton_phase: int = 0
 
@@ -106,29 +116,47 @@ class GalleryScreen(Screen):
         r = self._results[self._index]
 
         # Update info
-        price_str = f"${r['price']:.4f}" if r["price"] else "N/A"
-        stock_str = f"{r['stock']:,}" if r["stock"] else "N/A"
         info = (
-            f"{r['lcsc']}  |  {r['model']}  |  {r['brand']}  |  {r['package']}  |  {price_str}  |  Stock: {stock_str}"
+            f"{r['lcsc']}  |  {r['model']}  |  {r['brand']}  |  {r['package']}  |  "
+            f"{r['_price_str']}  |  Stock: {r['_stock_str']}"
         )
-        self.query_one("#gallery-info", Label).update(info)
-        self.query_one("#gallery-desc", Label).update(r.get("description", ""))
-
-        # Update nav buttons
-        self.query_one("#gallery-prev", Button).disabled = self._index <= 0
-        self.query_one("#gallery-next", Button).disabled = self._index >= len(self._results) - 1
-
-        # Load image
-        img_widget = self.query_one("#gallery-image", TIImage)
-        if self._index in self._image_cache:
-            self._stop_skeleton()
-            img = pil_from_bytes(self._image_cache[self._index])
-            if img is None:
-                img = make_no_image(200, 200)
-            img_widget.image = img
-        else:
-            self._start_skeleton()
-            self._fetch_image(self._index)
+        # One repaint for the labels, buttons and image instead of one per update
+        with self.app.batch_update():
+            self.query_one("#gallery-info", Label).update(info)
+            self.query_one("#gallery-desc", Label).update(r.get("description", ""))
+
+            # Update nav buttons
+            self.query_one("#gallery-prev", Button).disabled = self._index <= 0
+            self.query_one("#gallery-next", Button).disabled = self._index >= len(self._results) - 1
+
+            # Load image
+            img_widget = self.query_one("#gallery-image", TIImage)
+            img = get_decoded_image(r.get("url", ""))
+            if img is not None or self._index in self._no_image:
+                self._stop_skeleton()
+                img_widget.image = img if img is not None else make_no_image(200, 200)
+            else:
+                self._start_skeleton()
+                self._request_image(self._index)
+
+        # Prefetch the neighbors so Prev/Next usually find the image cached
+        for offset in (1, -1, 2, -2):
+            index = self._index + offset
+            if 0 <= index < len(self._results):
+                self._request_image(index)
+
+    def _request_image(self, index: int):
+        """Start fetching an image unless it is cached or already being fetched.
+
+        The image on screen is always fetched (from the memory cache if it was
+        prefetched) so the worker can decode it.
+        """
+        if index in self._no_image or index in self._in_flight:
+            return
+        if index != self._index and get_cached_image(self._results[index].get("url", "")) is not None:
+            return
+        self._in_flight.add(index)
+        self._fetch_image(index)
 
     @work(thread=True)
     def _fetch_image(self, index: int):
@@ -139,22 +167,33 @@ class GalleryScreen(Screen):
         if lcsc_url:
             try:
                 try:
-                    img_data = fetch_product_image(lcsc_url)
+                    img_data = fetch_product_image_cached(lcsc_url)
                 except SSLCertError:
                     allow_unverified_ssl()
-                    img_data = fetch_product_image(lcsc_url)
+                    img_data = fetch_product_image_cached(lcsc_url)
             except Exception:
                 pass
-        self._image_cache[index] = img_data
-        self.app.call_from_thread(self._set_image, index, img_data)
-
-    def _set_image(self, index: int, img_data: bytes | None):
-        if index == self._index:
-            self._stop_skeleton()
-            img = pil_from_bytes(img_data)
-            if img is None:
-                img = make_no_image(200, 200)
-            self.query_one("#gallery-image", TIImage).image = img
+        img = None
+        failed = img_data is None
+        # Decode here, and only for the image on screen: prefetched neighbors
+        # stay as bytes in the cache until they are shown
+        if not failed and index == self._index:
+            img = decode_product_image(lcsc_url, img_data)
+            failed = img is None
+        self.app.call_from_thread(self._set_image, index, img, failed)
+
+    def _set_image(self, index: int, img: PILImage.Image | None, failed: bool):
+        self._in_flight.discard(index)
+        if failed:
+            self._no_image.add(index)
+        if index != self._index:
+            return
+        if img is None and not failed:
+            # Prefetched without decoding just before it became current
+            self._request_image(index)
+            return
+        self._stop_skeleton()
+        self.query_one("#gallery-image", TIImage).image = img if img is not None else make_no_image(200, 200)
 
     def _start_skeleton(self):
         self._stop_skeleton()
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
+import math
 import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 
 from PIL import Image as PILImage
+from PIL import ImageDraw
 from textual_image.widget import (
     HalfcellImage as _HalfcellTIImage,
 )
@@ -13,6 +19,8 @@ from textual_image.widget import (
     Image as _AutoTIImage,
 )
 
+from kicad_jlcimport.easyeda.api import fetch_product_image
+
 # Warp and Rio have issues with native image protocols in Textual widgets,
 # so force half-cell rendering there.
 _term_program = os.environ.get("TERM_PROGRAM", "")
@@ -22,20 +30,154 @@ else:
     TIImage = _AutoTIImage
 
 
+# In-memory LRU of downloaded product images, keyed by product page URL and
+# shared by the detail pane and the gallery. ~128 photos of ~50 KB each.
+_IMAGE_LRU: OrderedDict[str, bytes] = OrderedDict()
+_IMAGE_LRU_MAX = 128
+_image_lru_lock = threading.Lock()
+
+
+def get_cached_image(lcsc_url: str) -> bytes | None:
+    """Return the in-memory cached image for *lcsc_url*, or None (no I/O)."""
+    with _image_lru_lock:
+        data = _IMAGE_LRU.get(lcsc_url)
+        if data is not None:
+            _IMAGE_LRU.move_to_end(lcsc_url)
+        return data
+
+
+def _put_cached_image(lcsc_url: str, data: bytes) -> None:
+    with _image_lru_lock:
+        _IMAGE_LRU[lcsc_url] = data
+        _IMAGE_LRU.move_to_end(lcsc_url)
+        while len(_IMAGE_LRU) > _IMAGE_LRU_MAX:
+            _IMAGE_LRU.popitem(last=False)
+
+
+# Decoded images for the most recently shown photos, so revisiting one does not
+# decode it again on the UI thread. Kept small: a decoded photo is ~1 MB.
+_DECODED_LRU: OrderedDict[str, PILImage.Image] = OrderedDict()
+_DECODED_LRU_MAX = 16
+
+
+def get_decoded_image(lcsc_url: str) -> PILImage.Image | None:
+    """Return the already-decoded image for *lcsc_url*, or None (no I/O or decoding)."""
+    with _image_lru_lock:
+        img = _DECODED_LRU.get(lcsc_url)
+        if img is not None:
+            _DECODED_LRU.move_to_end(lcsc_url)
+        return img
+
+
+def decode_product_image(lcsc_url: str, data: bytes | None) -> PILImage.Image | None:
+    """Decode *data* with pil_from_bytes and remember the result for *lcsc_url*.
+
+    Call from a worker thread; the UI thread then only needs get_decoded_image.
+    """
+    img = pil_from_bytes(data)
+    if img is not None:
+        with _image_lru_lock:
+            _DECODED_LRU[lcsc_url] = img
+            _DECODED_LRU.move_to_end(lcsc_url)
+            while len(_DECODED_LRU) > _DECODED_LRU_MAX:
+                _DECODED_LRU.popitem(last=False)
+    return img
+
+
+# Product photos kept on disk; the oldest are pruned after each new download.
+_IMAGE_CACHE_MAX_FILES = 500
+
+
+def _image_cache_dir() -> str:
+    """Directory for cached product images (like tools/_cache.py, under the XDG cache dir)."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "kicad_jlcimport", "images")
+
+
+def _prune_image_cache(cache_dir: str) -> None:
+    """Delete the least recently used files beyond _IMAGE_CACHE_MAX_FILES."""
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                entries.append((entry.stat().st_mtime, entry.path))
+    if len(entries) <= _IMAGE_CACHE_MAX_FILES:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - _IMAGE_CACHE_MAX_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def fetch_product_image_cached(lcsc_url: str) -> bytes | None:
+    """fetch_product_image with in-memory and on-disk caches keyed by the product page URL.
+
+    Product photos rarely change, so paging back in the gallery or searching
+    again in a later session skips both downloads. Failed fetches are not
+    cached, and SSLCertError propagates as from fetch_product_image.
+    """
+    if not lcsc_url:
+        return None
+    data = get_cached_image(lcsc_url)
+    if data is not None:
+        return data
+
+    cache_dir = _image_cache_dir()
+    key = hashlib.blake2b(lcsc_url.encode("utf-8"), digest_size=16).hexdigest()
+    path = os.path.join(cache_dir, key)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        _put_cached_image(lcsc_url, data)
+        try:
+            os.utime(path)  # mark as recently used so pruning keeps it
+        except OSError:
+            pass
+        return data
+    except OSError:
+        pass
+
+    data = fetch_product_image(lcsc_url)
+    if data:
+        _put_cached_image(lcsc_url, data)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write then rename so a concurrent fetch never reads a partial file
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+            _prune_image_cache(cache_dir)
+        except OSError:
+            # Non-fatal — cache is best-effort; don't leave a partial file behind
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+    return data
+
+
 def pil_from_bytes(data: bytes | None) -> PILImage.Image | None:
-    """Convert raw image bytes to a PIL Image, or None."""
+    """Decode raw image bytes to a PIL Image, or None.
+
+    The pixels are loaded here rather than on first render, so calling this
+    from a worker thread keeps the decode off the UI thread, and corrupt
+    data gives None instead of an error inside the image widget.
+    """
     if not data:
         return None
     try:
-        return PILImage.open(io.BytesIO(data))
+        img = PILImage.open(io.BytesIO(data))
+        img.load()
+        return img
     except Exception:
         return None
 
 
 def make_no_image(width: int, height: int) -> PILImage.Image:
     """Generate a 'no image' placeholder as a PIL Image."""
-    from PIL import ImageDraw
-
     img = PILImage.new("RGB", (width, height), (20, 20, 20))
     draw = ImageDraw.Draw(img)
     # Draw an X to indicate no image
@@ -46,15 +188,14 @@ def make_no_image(width: int, height: int) -> PILImage.Image:
     return img
 
 
+@lru_cache(maxsize=64)
 def make_skeleton_frame(width: int, height: int, phase: int) -> PILImage.Image:
     """Generate a skeleton shimmer frame as a PIL Image.
 
     Draws a dark gray rectangle with a lighter band sweeping left to right.
+    Frames are cached: the animation cycles through the same 20 phases, and
+    the image widgets copy the image they are given, so sharing is safe.
     """
-    import math
-
-    from PIL import ImageDraw
-
     img = PILImage.new("RGB", (width, height), (30, 30, 30))
     draw = ImageDraw.Draw(img)
     band_center = int(phase * (width + width // 2) / 100) - width // 4
@@ -1,37 +1,54 @@
 from types import SimpleNamespace
 
+import pytest
 
-def test_cli_import_project_writes_kicad_library(tmp_path, monkeypatch, capsys):
-    import kicad_jlcimport.cli as cli
-    import kicad_jlcimport.importer as importer
+import kicad_jlcimport.cli as cli
+import kicad_jlcimport.importer as importer
+import kicad_jlcimport.kicad.model3d as model3d
 
-    fake_comp = {
+
+class _Pad:
+    layer = "1"
+
+
+class _Footprint:
+    pads = [_Pad()]
+    tracks = []
+    model = None
+
+
+class _Symbol:
+    pins = [object(), object()]
+    rectangles = []
+
+
+@pytest.fixture
+def fake_comp():
+    """Minimal component dict with a footprint and no symbol units."""
+    return {
         "title": "TestPart",
         "prefix": "U",
-        "description": "desc",
-        "datasheet": "https://example.invalid/ds",
-        "manufacturer": "ACME",
-        "manufacturer_part": "MPN",
+        "description": "",
+        "datasheet": "",
+        "manufacturer": "",
+        "manufacturer_part": "",
         "footprint_data": {"dataStr": {"shape": ""}},
         "fp_origin_x": 0,
         "fp_origin_y": 0,
-        "symbol_data_list": [{"dataStr": {"shape": ""}}],
+        "symbol_data_list": [],
         "sym_origin_x": 0,
         "sym_origin_y": 0,
     }
 
-    class _Pad:
-        layer = "1"
-
-    class _Footprint:
-        pads = [_Pad()]
-        tracks = []
-        model = None
-
-    class _Symbol:
-        pins = [object(), object()]
-        rectangles = []
 
+def test_cli_import_project_writes_kicad_library(tmp_path, monkeypatch, capsys, fake_comp):
+    fake_comp.update(
+        description="desc",
+        datasheet="https://example.invalid/ds",
+        manufacturer="ACME",
+        manufacturer_part="MPN",
+        symbol_data_list=[{"dataStr": {"shape": ""}}],
+    )
     monkeypatch.setattr(importer, "fetch_full_component", lambda _lcsc: fake_comp)
     monkeypatch.setattr(importer, "parse_footprint_shapes", lambda *_a, **_k: _Footprint())
     monkeypatch.setattr(importer, "parse_symbol_shapes", lambda *_a, **_k: _Symbol())
@@ -53,38 +70,13 @@ def test_cli_import_project_writes_kicad_library(tmp_path, monkeypatch, capsys):
     out = capsys.readouterr().out
     assert "Project library tables updated." in out
     assert (tmp_path / "MyLib.pretty" / "TestPart.kicad_mod").exists()
+    assert (tmp_path / "MyLib.3dshapes").is_dir()
     assert (tmp_path / "MyLib.kicad_sym").exists()
     assert (tmp_path / "sym-lib-table").exists()
     assert (tmp_path / "fp-lib-table").exists()
 
 
-def test_cli_import_global_does_not_require_project_dir(tmp_path, monkeypatch, capsys):
-    import kicad_jlcimport.cli as cli
-    import kicad_jlcimport.importer as importer
-
-    fake_comp = {
-        "title": "TestPart",
-        "prefix": "U",
-        "description": "",
-        "datasheet": "",
-        "manufacturer": "",
-        "manufacturer_part": "",
-        "footprint_data": {"dataStr": {"shape": ""}},
-        "fp_origin_x": 0,
-        "fp_origin_y": 0,
-        "symbol_data_list": [],
-        "sym_origin_x": 0,
-        "sym_origin_y": 0,
-    }
-
-    class _Pad:
-        layer = "1"
-
-    class _Footprint:
-        pads = [_Pad()]
-        tracks = []
-        model = None
-
+def test_cli_import_global_does_not_require_project_dir(tmp_path, monkeypatch, capsys, fake_comp):
     monkeypatch.setattr(importer, "fetch_full_component", lambda _lcsc: fake_comp)
     monkeypatch.setattr(importer, "parse_footprint_shapes", lambda *_a, **_k: _Footprint())
     monkeypatch.setattr(importer, "write_footprint", lambda *_a, **_k: "fp\n")
@@ -108,35 +100,8 @@ def test_cli_import_global_does_not_require_project_dir(tmp_path, monkeypatch, c
     assert (tmp_path / "MyLib.pretty" / "TestPart.kicad_mod").exists()
 
 
-def test_cli_import_project_skips_existing_3d_models_without_overwrite(tmp_path, monkeypatch, capsys):
-    import kicad_jlcimport.cli as cli
-    import kicad_jlcimport.importer as importer
-    import kicad_jlcimport.kicad.model3d as model3d
-
-    fake_comp = {
-        "title": "TestPart",
-        "prefix": "U",
-        "description": "",
-        "datasheet": "",
-        "manufacturer": "",
-        "manufacturer_part": "",
-        "uuid_3d": "uuid",
-        "footprint_data": {"dataStr": {"shape": ""}},
-        "fp_origin_x": 0,
-        "fp_origin_y": 0,
-        "symbol_data_list": [],
-        "sym_origin_x": 0,
-        "sym_origin_y": 0,
-    }
-
-    class _Pad:
-        layer = "1"
-
-    class _Footprint:
-        pads = [_Pad()]
-        tracks = []
-        model = None
-
+def test_cli_import_project_skips_existing_3d_models_without_overwrite(tmp_path, monkeypatch, capsys, fake_comp):
+    fake_comp["uuid_3d"] = "uuid"
     monkeypatch.setattr(importer, "fetch_full_component", lambda _lcsc: fake_comp)
     monkeypatch.setattr(importer, "parse_footprint_shapes", lambda *_a, **_k: _Footprint())
     monkeypatch.setattr(importer, "write_footprint", lambda *_a, **_k: "fp\n")
@@ -180,38 +145,9 @@ def test_cli_import_project_skips_existing_3d_models_without_overwrite(tmp_path,
     assert ".wrl" in out
 
 
-def test_cli_import_with_kicad_v8(tmp_path, monkeypatch, capsys):
+def test_cli_import_with_kicad_v8(tmp_path, monkeypatch, capsys, fake_comp):
     """Test that --kicad-version 8 produces v8-format library files."""
-    import kicad_jlcimport.cli as cli
-    import kicad_jlcimport.importer as importer
-
-    fake_comp = {
-        "title": "TestPart",
-        "prefix": "U",
-        "description": "desc",
-        "datasheet": "",
-        "manufacturer": "",
-        "manufacturer_part": "",
-        "footprint_data": {"dataStr": {"shape": ""}},
-        "fp_origin_x": 0,
-        "fp_origin_y": 0,
-        "symbol_data_list": [{"dataStr": {"shape": ""}}],
-        "sym_origin_x": 0,
-        "sym_origin_y": 0,
-    }
-
-    class _Pad:
-        layer = "1"
-
-    class _Footprint:
-        pads = [_Pad()]
-        tracks = []
-        model = None
-
-    class _Symbol:
-        pins = [object()]
-        rectangles = []
-
+    fake_comp.update(description="desc", symbol_data_list=[{"dataStr": {"shape": ""}}])
     monkeypatch.setattr(importer, "fetch_full_component", lambda _lcsc: fake_comp)
     monkeypatch.setattr(importer, "parse_footprint_shapes", lambda *_a, **_k: _Footprint())
     monkeypatch.setattr(importer, "parse_symbol_shapes", lambda *_a, **_k: _Symbol())
@@ -238,34 +174,8 @@ def test_cli_import_with_kicad_v8(tmp_path, monkeypatch, capsys):
     assert "generator_version" not in sym_text
 
 
-def test_cli_global_lib_dir_overrides_default(tmp_path, monkeypatch, capsys):
+def test_cli_global_lib_dir_overrides_default(tmp_path, monkeypatch, capsys, fake_comp):
     """--global-lib-dir with --global uses the specified directory."""
-    import kicad_jlcimport.cli as cli
-    import kicad_jlcimport.importer as importer
-
-    fake_comp = {
-        "title": "TestPart",
-        "prefix": "U",
-        "description": "",
-        "datasheet": "",
-        "manufacturer": "",
-        "manufacturer_part": "",
-        "footprint_data": {"dataStr": {"shape": ""}},
-        "fp_origin_x": 0,
-        "fp_origin_y": 0,
-        "symbol_data_list": [],
-        "sym_origin_x": 0,
-        "sym_origin_y": 0,
-    }
-
-    class _Pad:
-        layer = "1"
-
-    class _Footprint:
-        pads = [_Pad()]
-        tracks = []
-        model = None
-
     monkeypatch.setattr(importer, "fetch_full_component", lambda _lcsc: fake_comp)
     monkeypatch.setattr(importer, "parse_footprint_shapes", lambda *_a, **_k: _Footprint())
     monkeypatch.setattr(importer, "write_footprint", lambda *_a, **_k: "fp\n")
@@ -292,34 +202,8 @@ def test_cli_global_lib_dir_overrides_default(tmp_path, monkeypatch, capsys):
     assert (tmp_path / "MyLib.pretty" / "TestPart.kicad_mod").exists()
 
 
-def test_cli_global_lib_dir_implies_global(tmp_path, monkeypatch, capsys):
+def test_cli_global_lib_dir_implies_global(tmp_path, monkeypatch, capsys, fake_comp):
     """--global-lib-dir without --global still triggers a global import."""
-    import kicad_jlcimport.cli as cli
-    import kicad_jlcimport.importer as importer
-
-    fake_comp = {
-        "title": "TestPart",
-        "prefix": "U",
-        "description": "",
-        "datasheet": "",
-        "manufacturer": "",
-        "manufacturer_part": "",
-        "footprint_data": {"dataStr": {"shape": ""}},
-        "fp_origin_x": 0,
-        "fp_origin_y": 0,
-        "symbol_data_list": [],
-        "sym_origin_x": 0,
-        "sym_origin_y": 0,
-    }
-
-    class _Pad:
-        layer = "1"
-
-    class _Footprint:
-        pads = [_Pad()]
-        tracks = []
-        model = None
-
     monkeypatch.setattr(importer, "fetch_full_component", lambda _lcsc: fake_comp)
     monkeypatch.setattr(importer, "parse_footprint_shapes", lambda *_a, **_k: _Footprint())
     monkeypatch.setattr(importer, "write_footprint", lambda *_a, **_k: "fp\n")
@@ -345,7 +229,6 @@ def test_cli_global_lib_dir_implies_global(tmp_path, monkeypatch, capsys):
 
 def test_cli_global_lib_dir_nonexistent_errors(tmp_path, capsys):
     """--global-lib-dir pointing to a missing directory prints an error."""
-    import kicad_jlcimport.cli as cli
 
     args = SimpleNamespace(
         part="C123",
@@ -366,7 +249,6 @@ def test_cli_global_lib_dir_nonexistent_errors(tmp_path, capsys):
 
 def test_cli_global_lib_dir_argparse(monkeypatch):
     """--global-lib-dir is parsed correctly by argparse."""
-    import kicad_jlcimport.cli as cli
 
     monkeypatch.setattr("sys.argv", ["prog", "import", "C123", "--global", "--global-lib-dir", "/some/path"])
     # Patch main to capture args instead of running cmd_import
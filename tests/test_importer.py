@@ -1,10 +1,11 @@
 """Tests for importer.py to improve coverage."""
 
 import os
+import threading
 
 from kicad_jlcimport import importer
 from kicad_jlcimport.easyeda.ee_types import EE3DModel, EEFootprint, EEPad, EEPin, EESymbol
-from kicad_jlcimport.importer import _build_description, _build_keywords
+from kicad_jlcimport.importer import _build_description, _build_keywords, _check_existing_files
 
 
 class TestImportComponent:
@@ -199,6 +200,60 @@ class TestImportComponent:
         assert "STEP saved" in " ".join(log_messages)
         assert "WRL saved" in " ".join(log_messages)
 
+    def test_step_download_overlaps_wrl_download(self, tmp_path, monkeypatch):
+        """STEP is fetched on a worker thread while the WRL source downloads."""
+        fake_comp = self._make_fake_comp(with_symbol=False, with_3d=True)
+        # Both downloads must be in flight at once to get past the barrier
+        both_started = threading.Barrier(2, timeout=5)
+        threads = {}
+
+        def fake_step(_):
+            threads["step"] = threading.current_thread()
+            both_started.wait()
+            return b"STEP"
+
+        def fake_wrl(_):
+            threads["wrl"] = threading.current_thread()
+            both_started.wait()
+            return "v 0 0 0\n"
+
+        monkeypatch.setattr(importer, "fetch_full_component", lambda _: fake_comp)
+        monkeypatch.setattr(importer, "parse_footprint_shapes", lambda *a, **k: self._make_fake_footprint())
+        monkeypatch.setattr(importer, "write_footprint", lambda *a, **k: "(footprint TestPart)\n")
+        monkeypatch.setattr(importer, "download_step", fake_step)
+        monkeypatch.setattr(importer, "download_wrl_source", fake_wrl)
+
+        importer.import_component("C123", str(tmp_path), "TestLib", export_only=True, log=lambda msg: None)
+
+        assert threads["step"] is not threads["wrl"]
+        assert (tmp_path / "3dmodels" / "TestPart.step").read_bytes() == b"STEP"
+
+    def test_symbol_parsed_while_wrl_downloads(self, tmp_path, monkeypatch):
+        """The WRL source downloads in the background while the symbol is parsed."""
+        fake_comp = self._make_fake_comp(with_symbol=True, with_3d=True)
+        fake_sym = self._make_fake_symbol()
+        symbol_parsed = threading.Event()
+
+        def fake_parse_symbol(*a, **k):
+            symbol_parsed.set()
+            return fake_sym
+
+        def fake_wrl(_):
+            assert symbol_parsed.wait(timeout=5), "symbol was not parsed during the WRL download"
+            return None
+
+        monkeypatch.setattr(importer, "fetch_full_component", lambda _: fake_comp)
+        monkeypatch.setattr(importer, "parse_footprint_shapes", lambda *a, **k: self._make_fake_footprint())
+        monkeypatch.setattr(importer, "parse_symbol_shapes", fake_parse_symbol)
+        monkeypatch.setattr(importer, "write_footprint", lambda *a, **k: "(footprint TestPart)\n")
+        monkeypatch.setattr(importer, "write_symbol", lambda *a, **k: '  (symbol "TestPart")\n')
+        monkeypatch.setattr(importer, "download_step", lambda _: b"STEP")
+        monkeypatch.setattr(importer, "download_wrl_source", fake_wrl)
+
+        result = importer.import_component("C123", str(tmp_path), "TestLib", export_only=True, log=lambda msg: None)
+
+        assert result["name"] == "TestPart"
+
     def test_import_3d_model_skipped_without_overwrite(self, tmp_path, monkeypatch):
         """Test that existing 3D models are skipped without overwrite."""
         log_messages = []
@@ -1001,3 +1056,48 @@ class TestConfirmOverwrite:
 
         assert result is not None
         assert len(callback_called) == 0
+
+
+class TestCheckExistingFiles:
+    """Tests for _check_existing_files."""
+
+    def test_nothing_exists(self, tmp_path):
+        assert _check_existing_files(str(tmp_path), "TestLib", "TestPart") == []
+
+    def test_missing_lib_dir(self, tmp_path):
+        assert _check_existing_files(str(tmp_path / "nope"), "TestLib", "TestPart") == []
+
+    def test_detects_symbol_in_library(self, tmp_path):
+        (tmp_path / "TestLib.kicad_sym").write_text(
+            '(kicad_symbol_lib\n  (symbol "Other")\n  (symbol "TestPart"\n  )\n)\n', encoding="utf-8"
+        )
+        assert _check_existing_files(str(tmp_path), "TestLib", "TestPart") == ["symbol"]
+        assert _check_existing_files(str(tmp_path), "TestLib", "Missing") == []
+
+    def test_symbol_name_prefix_does_not_match(self, tmp_path):
+        (tmp_path / "TestLib.kicad_sym").write_text('(kicad_symbol_lib\n  (symbol "TestPart2")\n)\n')
+        assert _check_existing_files(str(tmp_path), "TestLib", "TestPart") == []
+
+    def test_empty_symbol_library(self, tmp_path):
+        (tmp_path / "TestLib.kicad_sym").write_text("")
+        assert _check_existing_files(str(tmp_path), "TestLib", "TestPart") == []
+
+    def test_detects_footprint_and_model(self, tmp_path):
+        (tmp_path / "TestLib.pretty").mkdir()
+        (tmp_path / "TestLib.pretty" / "TestPart.kicad_mod").write_text("(footprint)")
+        (tmp_path / "TestLib.3dshapes").mkdir()
+        (tmp_path / "TestLib.3dshapes" / "TestPart.wrl").write_text("#VRML")
+        assert _check_existing_files(str(tmp_path), "TestLib", "TestPart") == ["footprint", "3D model"]
+
+    def test_symbol_names_cached_until_file_changes(self, tmp_path):
+        sym = tmp_path / "TestLib.kicad_sym"
+        sym.write_text('(kicad_symbol_lib\n  (symbol "A")\n)\n')
+        assert importer._symbol_names(str(sym)) == {"A"}
+
+        # Same mtime/size: the cached entry is returned without rescanning
+        key, _names = importer._SYMLIB_NAMES_CACHE[str(sym)]
+        importer._SYMLIB_NAMES_CACHE[str(sym)] = (key, frozenset({"cached"}))
+        assert importer._symbol_names(str(sym)) == {"cached"}
+
+        sym.write_text('(kicad_symbol_lib\n  (symbol "A")\n  (symbol "B")\n)\n')
+        assert importer._symbol_names(str(sym)) == {"A", "B"}
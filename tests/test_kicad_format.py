@@ -59,6 +59,12 @@ class TestFmtFloat:
         result = fmt_float(1e11 + 0.5)
         assert "." in result
 
+    def test_tiny_negative_rounds_to_unsigned_zero(self):
+        assert fmt_float(-0.0000001) == "0"
+
+    def test_large_whole_number(self):
+        assert fmt_float(1e12) == "1000000000000"
+
     def test_nan_returns_zero(self):
         assert fmt_float(float("nan")) == "0"
 
@@ -68,6 +74,17 @@ class TestFmtFloat:
     def test_negative_inf_returns_zero(self):
         assert fmt_float(float("-inf")) == "0"
 
+    def test_cached_int_and_float_keys_agree(self):
+        # 2 and 2.0 share a cache slot; both must format identically
+        assert fmt_float(2.0) == fmt_float(2) == "2"
+        assert fmt_float(-0.0) == fmt_float(0) == "0"
+
+    def test_repeated_calls_hit_cache(self):
+        fmt_float.cache_clear()
+        fmt_float(1.27)
+        fmt_float(1.27)
+        assert fmt_float.cache_info().hits == 1
+
 
 class TestEscapeSexpr:
     def test_no_escaping_needed(self):
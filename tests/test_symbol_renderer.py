@@ -3,18 +3,21 @@
 import pytest
 
 
-class TestRenderSvgBitmap:
-    """render_svg_bitmap requires wx.App."""
+@pytest.fixture(scope="module")
+def wx_app():
+    # Module-scoped: creating a wx.App is slow, and one serves every test
+    try:
+        import wx
+
+        app = wx.App.Get() or wx.App()
+    except (Exception, SystemExit):
+        pytest.skip("wx not available")
+    yield app
 
-    @pytest.fixture(autouse=True)
-    def _needs_wx(self):
-        try:
-            import wx
 
-            if not wx.App.Get():
-                self._app = wx.App()
-        except (Exception, SystemExit):
-            pytest.skip("wx not available")
+@pytest.mark.usefixtures("wx_app")
+class TestRenderSvgBitmap:
+    """render_svg_bitmap requires wx.App."""
 
     def test_valid_svg(self):
         from kicad_jlcimport.gui.symbol_renderer import render_svg_bitmap
@@ -0,0 +1,154 @@
+"""Tests for tui/app.py - imported part tracking and result rows."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    import textual  # noqa: F401
+    import textual_image  # noqa: F401
+
+    _has_textual = True
+except ImportError:
+    _has_textual = False
+
+pytestmark = pytest.mark.skipif(not _has_textual, reason="textual not installed")
+
+
+def _make_self(lib_dir, use_global=False):
+    radio = SimpleNamespace(value=use_global)
+    return SimpleNamespace(
+        _lib_name="JLCImport",
+        _global_lib_dir=str(lib_dir),
+        _project_dir=str(lib_dir),
+        _imported_ids=set(),
+        _imported_ids_cache={},
+        query_one=lambda *args: radio,
+    )
+
+
+class TestRefreshImportedIds:
+    def test_collects_lcsc_ids(self, tmp_path):
+        from kicad_jlcimport.tui.app import JLCImportTUI
+
+        (tmp_path / "JLCImport.kicad_sym").write_text(
+            '(kicad_symbol_lib\n  (symbol "R1"\n    (property "LCSC" "C25804" (at 0 0 0))\n  )\n'
+            '  (symbol "U1"\n    (property "LCSC" "C427602" (at 0 0 0))\n  )\n)\n',
+            encoding="utf-8",
+        )
+        fake = _make_self(tmp_path)
+        JLCImportTUI._refresh_imported_ids(fake)
+        assert fake._imported_ids == {"C25804", "C427602"}
+
+    def test_ignores_non_lcsc_values(self, tmp_path):
+        from kicad_jlcimport.tui.app import JLCImportTUI
+
+        (tmp_path / "JLCImport.kicad_sym").write_bytes(
+            b'(kicad_symbol_lib\n  (symbol "R1" (property "LCSC" "C25804"))\n'
+            b'  (symbol "R2" (property "LCSC" ""))\n  (symbol "R3" (property "LCSC" "C"))\n'
+            b'  (symbol "R4" (property "LCSC" "C12x"))\n  (symbol "R5" (property "LCSC" "\xc3\xa9"))\n)\n'
+        )
+        fake = _make_self(tmp_path)
+        JLCImportTUI._refresh_imported_ids(fake)
+        assert fake._imported_ids == {"C25804"}
+
+    def test_ignores_unterminated_property(self, tmp_path):
+        from kicad_jlcimport.tui.app import JLCImportTUI
+
+        (tmp_path / "JLCImport.kicad_sym").write_bytes(
+            b'(kicad_symbol_lib\n  (symbol "R1"\n    (property "LCSC" "C25804" (at 0 0 0))\n'
+            b'  (symbol "U1"\n    (property "LCSC" "C4276'
+        )
+        fake = _make_self(tmp_path)
+        JLCImportTUI._refresh_imported_ids(fake)
+        assert fake._imported_ids == {"C25804"}
+
+    def test_unchanged_library_is_not_rescanned(self, tmp_path):
+        from kicad_jlcimport.tui.app import JLCImportTUI
+
+        lib = tmp_path / "JLCImport.kicad_sym"
+        lib.write_bytes(b'(kicad_symbol_lib (symbol "R1" (property "LCSC" "C25804")))')
+        fake = _make_self(tmp_path)
+        JLCImportTUI._refresh_imported_ids(fake)
+        st = lib.stat()
+        # Same size and mtime, different id: the cached scan is reused
+        lib.write_bytes(b'(kicad_symbol_lib (symbol "R1" (property "LCSC" "C99999")))')
+        os.utime(lib, ns=(st.st_atime_ns, st.st_mtime_ns))
+        fake._imported_ids = set()
+        JLCImportTUI._refresh_imported_ids(fake)
+        assert fake._imported_ids == {"C25804"}
+
+    def test_modified_library_is_rescanned(self, tmp_path):
+        from kicad_jlcimport.tui.app import JLCImportTUI
+
+        lib = tmp_path / "JLCImport.kicad_sym"
+        lib.write_bytes(b'(kicad_symbol_lib (symbol "R1" (property "LCSC" "C25804")))')
+        fake = _make_self(tmp_path)
+        JLCImportTUI._refresh_imported_ids(fake)
+        lib.write_bytes(b'(kicad_symbol_lib (symbol "R1" (property "LCSC" "C25804")) (property "LCSC" "C1"))')
+        JLCImportTUI._refresh_imported_ids(fake)
+        assert fake._imported_ids == {"C25804", "C1"}
+
+    def test_missing_library(self, tmp_path):
+        from kicad_jlcimport.tui.app import JLCImportTUI
+
+        fake = _make_self(tmp_path)
+        JLCImportTUI._refresh_imported_ids(fake)
+        assert fake._imported_ids == set()
+
+    def test_empty_library(self, tmp_path):
+        from kicad_jlcimport.tui.app import JLCImportTUI
+
+        (tmp_path / "JLCImport.kicad_sym").write_bytes(b"")
+        fake = _make_self(tmp_path)
+        JLCImportTUI._refresh_imported_ids(fake)
+        assert fake._imported_ids == set()
+
+
+class TestMarkImported:
+    def test_adds_id_for_current_destination(self, tmp_path):
+        from kicad_jlcimport.tui.app import JLCImportTUI
+
+        fake = _make_self(tmp_path, use_global=True)
+        JLCImportTUI._mark_imported(fake, "C427602", True)
+        assert fake._imported_ids == {"C427602"}
+
+    def test_ignores_import_into_other_destination(self, tmp_path):
+        from kicad_jlcimport.tui.app import JLCImportTUI
+
+        fake = _make_self(tmp_path, use_global=False)
+        JLCImportTUI._mark_imported(fake, "C427602", True)
+        assert fake._imported_ids == set()
+
+
+class TestAnnotateRow:
+    def test_formats_price_and_stock(self):
+        from kicad_jlcimport.tui.app import _annotate_row
+
+        r = {"price": 0.0123, "stock": 1234567}
+        _annotate_row(r)
+        assert r["_price_str"] == "$0.0123"
+        assert r["_stock_str"] == "1,234,567"
+
+    def test_missing_values_show_na(self):
+        from kicad_jlcimport.tui.app import _annotate_row
+
+        r = {"price": None, "stock": 0}
+        _annotate_row(r)
+        assert r["_price_str"] == "N/A"
+        assert r["_stock_str"] == "N/A"
+
+    def test_sort_keys(self):
+        from kicad_jlcimport.tui.app import _SORT_KEYS, _annotate_row
+
+        rows = [
+            {"lcsc": "C2", "price": None, "stock": 5, "model": "b", "package": "0603", "description": "Y"},
+            {"lcsc": "C1", "price": 0.5, "stock": None, "model": "A", "package": "0402", "description": "x"},
+        ]
+        for r in rows:
+            _annotate_row(r)
+        assert [r["lcsc"] for r in sorted(rows, key=_SORT_KEYS[2])] == ["C2", "C1"]
+        assert [r["lcsc"] for r in sorted(rows, key=_SORT_KEYS[3])] == ["C1", "C2"]
+        assert [r["lcsc"] for r in sorted(rows, key=_SORT_KEYS[4])] == ["C1", "C2"]
+        assert [r["lcsc"] for r in sorted(rows, key=_SORT_KEYS[6])] == ["C1", "C2"]
@@ -0,0 +1,153 @@
+"""Tests for tui/helpers.py - product image cache."""
+
+import hashlib
+import io
+import os
+from collections import OrderedDict
+
+import pytest
+
+try:
+    import textual_image  # noqa: F401
+
+    _has_textual_image = True
+except ImportError:
+    _has_textual_image = False
+
+pytestmark = pytest.mark.skipif(not _has_textual_image, reason="textual-image not installed")
+
+
+@pytest.fixture
+def helpers(tmp_path, monkeypatch):
+    from kicad_jlcimport.tui import helpers
+
+    monkeypatch.setattr(helpers, "_image_cache_dir", lambda: str(tmp_path / "images"))
+    monkeypatch.setattr(helpers, "_IMAGE_LRU", OrderedDict())
+    monkeypatch.setattr(helpers, "_DECODED_LRU", OrderedDict())
+    return helpers
+
+
+class TestFetchProductImageCached:
+    def test_second_fetch_reads_from_disk(self, helpers, monkeypatch):
+        calls = []
+
+        def fake_fetch(url):
+            calls.append(url)
+            return b"\x89PNG data"
+
+        monkeypatch.setattr(helpers, "fetch_product_image", fake_fetch)
+        url = "https://jlcpcb.com/product/C427602"
+        assert helpers.fetch_product_image_cached(url) == b"\x89PNG data"
+        assert helpers.fetch_product_image_cached(url) == b"\x89PNG data"
+        assert calls == [url]
+
+    def test_failed_fetch_is_not_cached(self, helpers, monkeypatch):
+        calls = []
+
+        def fake_fetch(url):
+            calls.append(url)
+            return None
+
+        monkeypatch.setattr(helpers, "fetch_product_image", fake_fetch)
+        url = "https://jlcpcb.com/product/C427602"
+        assert helpers.fetch_product_image_cached(url) is None
+        assert helpers.fetch_product_image_cached(url) is None
+        assert len(calls) == 2
+
+    def test_empty_url(self, helpers, monkeypatch):
+        monkeypatch.setattr(helpers, "fetch_product_image", lambda url: pytest.fail("should not fetch"))
+        assert helpers.fetch_product_image_cached("") is None
+
+    def test_disk_hit_populates_memory_cache(self, helpers, monkeypatch):
+        monkeypatch.setattr(helpers, "fetch_product_image", lambda url: b"img")
+        url = "https://jlcpcb.com/product/C427602"
+        helpers.fetch_product_image_cached(url)
+        helpers._IMAGE_LRU.clear()
+        monkeypatch.setattr(helpers, "fetch_product_image", lambda url: pytest.fail("should not fetch"))
+        assert helpers.get_cached_image(url) is None
+        assert helpers.fetch_product_image_cached(url) == b"img"
+        assert helpers.get_cached_image(url) == b"img"
+
+    def test_disk_cache_pruned_to_max_files(self, helpers, monkeypatch, tmp_path):
+        monkeypatch.setattr(helpers, "_IMAGE_CACHE_MAX_FILES", 2)
+        monkeypatch.setattr(helpers, "fetch_product_image", lambda url: url.encode())
+        for i, url in enumerate(("a", "b", "c")):
+            helpers.fetch_product_image_cached(url)
+            # Distinct mtimes so the oldest download is the one pruned
+            path = tmp_path / "images" / hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+            os.utime(path, (1000 + i, 1000 + i))
+        helpers._IMAGE_LRU.clear()
+        assert len(list((tmp_path / "images").iterdir())) == 2
+        monkeypatch.setattr(helpers, "fetch_product_image", lambda url: None)
+        assert helpers.fetch_product_image_cached("a") is None
+        assert helpers.fetch_product_image_cached("c") == b"c"
+
+    def test_cache_dir_under_xdg_cache_home(self, monkeypatch, tmp_path):
+        from kicad_jlcimport.tui import helpers
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert helpers._image_cache_dir() == str(tmp_path / "kicad_jlcimport" / "images")
+
+
+class TestImageLru:
+    def test_evicts_least_recently_used(self, helpers, monkeypatch):
+        monkeypatch.setattr(helpers, "_IMAGE_LRU_MAX", 2)
+        helpers._put_cached_image("a", b"1")
+        helpers._put_cached_image("b", b"2")
+        assert helpers.get_cached_image("a") == b"1"  # "b" is now the oldest
+        helpers._put_cached_image("c", b"3")
+        assert helpers.get_cached_image("b") is None
+        assert helpers.get_cached_image("a") == b"1"
+        assert helpers.get_cached_image("c") == b"3"
+
+
+class TestPilFromBytes:
+    def test_decodes_png(self, helpers):
+        from PIL import Image
+
+        buf = io.BytesIO()
+        Image.new("RGB", (4, 3), "red").save(buf, format="PNG")
+        img = helpers.pil_from_bytes(buf.getvalue())
+        assert img.size == (4, 3)
+        assert img.getpixel((0, 0)) == (255, 0, 0)
+
+    def test_truncated_data_returns_none(self, helpers):
+        from PIL import Image
+
+        buf = io.BytesIO()
+        Image.new("RGB", (64, 64), "red").save(buf, format="PNG")
+        assert helpers.pil_from_bytes(buf.getvalue()[:60]) is None
+
+    def test_empty_data_returns_none(self, helpers):
+        assert helpers.pil_from_bytes(b"") is None
+        assert helpers.pil_from_bytes(None) is None
+
+
+class TestDecodeProductImage:
+    @staticmethod
+    def _png():
+        from PIL import Image
+
+        buf = io.BytesIO()
+        Image.new("RGB", (4, 3), "red").save(buf, format="PNG")
+        return buf.getvalue()
+
+    def test_decoded_image_is_reused(self, helpers):
+        img = helpers.decode_product_image("a", self._png())
+        assert img.size == (4, 3)
+        assert helpers.get_decoded_image("a") is img
+
+    def test_corrupt_data_is_not_cached(self, helpers):
+        assert helpers.decode_product_image("a", b"junk") is None
+        assert helpers.get_decoded_image("a") is None
+
+    def test_evicts_least_recently_used(self, helpers, monkeypatch):
+        monkeypatch.setattr(helpers, "_DECODED_LRU_MAX", 2)
+        data = self._png()
+        helpers.decode_product_image("a", data)
+        helpers.decode_product_image("b", data)
+        assert helpers.get_decoded_image("a") is not None  # "b" is now the oldest
+        helpers.decode_product_image("c", data)
+        assert helpers.get_decoded_image("b") is None
+        assert helpers.get_decoded_image("a") is not None
+        assert helpers.get_decoded_image("c") is not None
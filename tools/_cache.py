@@ -0,0 +1,83 @@
+"""On-disk cache for EasyEDA API responses used by the developer tools.
+
+Part data rarely changes, so tools that re-run against the same LCSC ids
+(compare_part, fetch_test_data) can skip the network after the first run.
+Entries are JSON files under ``~/.cache/kicad_jlcimport/<namespace>/``.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+try:
+    import orjson
+
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "kicad_jlcimport"
+
+_enabled = True
+
+
+def json_loads(data):
+    """json.loads that uses orjson when it is installed.
+
+    Takes str or bytes. orjson's decode error subclasses json.JSONDecodeError,
+    so callers catch the same exception either way.
+    """
+    return orjson.loads(data) if _has_orjson else json.loads(data)
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn the cache on or off for every wrapped function (e.g. for --no-cache)."""
+    global _enabled
+    _enabled = enabled
+
+
+def disk_cache(namespace: str, ttl_days: float = 30):
+    """Cache a function's JSON-serializable result on disk, keyed by its arguments.
+
+    ``None`` results are not cached, so failed downloads are retried on the
+    next run.
+    """
+    ttl = ttl_days * 86400
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            if not _enabled:
+                return func(*args)
+
+            key = hashlib.blake2b(json.dumps(args).encode("utf-8"), digest_size=16).hexdigest()
+            path = CACHE_DIR / namespace / f"{key}.json"
+            try:
+                if time.time() - path.stat().st_mtime < ttl:
+                    return json_loads(path.read_bytes())
+            except (OSError, ValueError):
+                pass
+
+            result = func(*args)
+            if result is not None:
+                # Write then rename so parallel workers never read a partial entry
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                try:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp.write_text(json.dumps(result), encoding="utf-8")
+                    os.replace(tmp, path)
+                except OSError:
+                    # Non-fatal — cache is best-effort; the fetch itself succeeded
+                    try:
+                        tmp.unlink()
+                    except OSError:
+                        pass
+            return result
+
+        return wrapper
+
+    return decorator
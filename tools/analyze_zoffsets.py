@@ -1,16 +1,25 @@
 #!/usr/bin/env python3
 """Analyze z-offset calculations for test parts."""
 
-import json
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
+import _cache
+
 from kicad_jlcimport.easyeda.parser import parse_footprint_shapes
 from kicad_jlcimport.kicad.model3d import _obj_bounding_box, compute_model_transform
 
 
+@lru_cache(maxsize=None)
+def _load_json(path: Path):
+    """Parse a JSON file, memoized per path for repeated analysis runs."""
+    data = path.read_bytes()
+    return _cache.json_loads(data)
+
+
 def analyze_part(lcsc_id: str, testdata_dir: Path):
     """Analyze z-offset calculation for a part."""
     print(f"\n=== {lcsc_id} ===")
@@ -21,8 +30,7 @@ def analyze_part(lcsc_id: str, testdata_dir: Path):
         print("  No footprint data found")
         return
 
-    with open(fp_path) as f:
-        fp_data = json.load(f)
+    fp_data = _load_json(fp_path)
 
     fp_head = fp_data["dataStr"]["head"]
     fp_origin_x = fp_head["x"]
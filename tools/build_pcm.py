@@ -17,6 +17,17 @@ SRC_DIR = os.path.join(ROOT, "src", "kicad_jlcimport")
 METADATA = os.path.join(ROOT, "metadata.json")
 DIST_DIR = os.path.join(ROOT, "dist")
 
+# Already-compressed formats: deflating these costs CPU for no size gain
+_STORED_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".zip", ".whl", ".gz", ".svgz", ".woff", ".woff2")
+
+
+def _parse_version(name: str):
+    """Return *name* as a float version number, or None if it isn't one."""
+    try:
+        return float(name)
+    except ValueError:
+        return None
+
 
 def _kicad_3rdparty_plugins() -> str:
     """Return the KiCad 3rdparty plugins directory for the current platform."""
@@ -30,34 +41,52 @@ def _kicad_3rdparty_plugins() -> str:
     # Find the newest version directory
     best = "9.0"
     if os.path.isdir(base):
-        for d in os.listdir(base):
-            try:
-                if float(d) > float(best):
-                    best = d
-            except ValueError:
-                continue
+        with os.scandir(base) as it:
+            versions = [(v, e.name) for e in it if e.is_dir() and (v := _parse_version(e.name)) is not None]
+        # 9.0 stays the floor, as before, when only older versions exist
+        best = max([(float(best), best), *versions])[1]
 
     return os.path.join(base, best, "3rdparty", "plugins", "com_github_jvanderberg_kicad-jlcimport")
 
 
+def _walk(directory: str, prefix_len: int):
+    """Yield (full_path, arcname) for every file to package under *directory*.
+
+    Uses os.scandir so directory/file checks come from the cached DirEntry
+    data, and derives arcnames by slicing off the SRC_DIR prefix.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "__pycache__":
+                    yield from _walk(entry.path, prefix_len)
+            elif entry.is_file() and not entry.name.endswith((".pyc", ".pyo")):
+                yield entry.path, "plugins/" + entry.path[prefix_len:].replace(os.sep, "/")
+
+
+def _source_files() -> list:
+    """Return sorted (full_path, arcname) pairs for every file to package."""
+    return sorted(_walk(SRC_DIR, len(SRC_DIR) + 1), key=lambda f: f[1])
+
+
 def build_zip() -> str:
     """Build the PCM ZIP and return its path."""
     os.makedirs(DIST_DIR, exist_ok=True)
     zip_path = os.path.join(DIST_DIR, "JLCImport-dev.zip")
 
+    # Collect the file list up front so the traversal is finished before
+    # any compression starts, and the archive order is reproducible
+    files = _source_files()
+
     with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
         # Add metadata.json at root
         zf.write(METADATA, "metadata.json")
 
         # Add all source files under plugins/
-        for dirpath, dirnames, filenames in os.walk(SRC_DIR):
-            # Skip __pycache__
-            dirnames[:] = [d for d in dirnames if d != "__pycache__"]
-            for filename in filenames:
-                if filename.endswith((".pyc", ".pyo")):
-                    continue
-                full_path = os.path.join(dirpath, filename)
-                arcname = os.path.join("plugins", os.path.relpath(full_path, SRC_DIR))
+        for full_path, arcname in files:
+            if arcname.lower().endswith(_STORED_SUFFIXES):
+                zf.write(full_path, arcname, compress_type=zipfile.ZIP_STORED)
+            else:
                 zf.write(full_path, arcname)
 
     return zip_path
@@ -66,14 +95,31 @@ def build_zip() -> str:
 def install(zip_path: str) -> str:
     """Extract the PCM ZIP into KiCad's 3rdparty plugins directory."""
     dest = _kicad_3rdparty_plugins()
-    plugins_dest = os.path.join(dest, "plugins")
 
-    # Clean existing installation
-    if os.path.isdir(plugins_dest):
-        shutil.rmtree(plugins_dest)
-
-    with zipfile.ZipFile(zip_path, "r") as zf:
-        zf.extractall(dest)
+    # Extract into a sibling staging dir first so KiCad never sees a
+    # half-populated plugin directory, then swap the whole directory in:
+    # move the old install aside, rename staging into place, and only then
+    # delete the old tree
+    staging = dest + ".new"
+    old = dest + ".old"
+    shutil.rmtree(staging, ignore_errors=True)
+    shutil.rmtree(old, ignore_errors=True)
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            zf.extractall(staging)
+        had_old = os.path.isdir(dest)
+        if had_old:
+            os.replace(dest, old)
+        try:
+            os.replace(staging, dest)
+        except OSError:
+            if had_old:
+                os.replace(old, dest)  # put the previous install back
+            raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    shutil.rmtree(old, ignore_errors=True)
 
     return dest
 
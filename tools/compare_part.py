@@ -13,11 +13,14 @@ import tempfile
 import time
 import webbrowser
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
+import _cache
+
 from kicad_jlcimport.easyeda.api import download_wrl_source, fetch_component_uuids, fetch_full_component
 from kicad_jlcimport.easyeda.parser import parse_footprint_shapes, parse_symbol_shapes
 from kicad_jlcimport.kicad.footprint_writer import write_footprint
@@ -25,8 +28,48 @@ from kicad_jlcimport.kicad.library import sanitize_name
 from kicad_jlcimport.kicad.model3d import compute_model_transform, convert_to_vrml
 from kicad_jlcimport.kicad.symbol_writer import write_symbol, write_symbol_library
 
+# Part data is stable, so repeat runs on the same parts skip the network.
+# Within a run, the lru_cache only serves lookups made after a part's first
+# fetch has returned; workers that miss concurrently each fetch it.
+fetch_component_uuids = lru_cache(maxsize=256)(_cache.disk_cache("component_uuids")(fetch_component_uuids))
+fetch_full_component = lru_cache(maxsize=256)(_cache.disk_cache("full_component")(fetch_full_component))
+download_wrl_source = lru_cache(maxsize=256)(_cache.disk_cache("wrl_source")(download_wrl_source))
+
+_VIEWBOX_RE = re.compile(r'viewBox="([^"]+)"')
+_COORD_RE = re.compile(r"\((?:at|start|end|xy)\s+([-\d.]+)\s+([-\d.]+)")
+_FOOTPRINT_HEAD_RE = re.compile(r'(\(footprint "[^"]*"\s*\n)')
+
 KICAD_CLI = shutil.which("kicad-cli") or "/Applications/KiCad/KiCad.app/Contents/MacOS/kicad-cli"
 
+# Board wrapper shared by every minimal PCB built for kicad-cli exports
+_PCB_HEADER = """\
+(kicad_pcb
+  (version 20240108)
+  (generator "kicad_jlcimport")
+  (general
+    (thickness 1.6)
+    (legacy_teardrops no)
+  )
+  (paper "A4")
+  (layers
+    (0 "F.Cu" signal)
+    (31 "B.Cu" signal)
+    (36 "B.SilkS" user "B.Silkscreen")
+    (37 "F.SilkS" user "F.Silkscreen")
+    (38 "B.Mask" user)
+    (39 "F.Mask" user)
+    (44 "Edge.Cuts" user)
+    (46 "B.CrtYd" user "B.Courtyard")
+    (47 "F.CrtYd" user "F.Courtyard")
+    (48 "B.Fab" user)
+    (49 "F.Fab" user)
+  )
+  (setup
+    (pad_to_mask_clearance 0.05)
+  )
+  (net 0 "")
+"""
+
 
 def fetch_easyeda_svgs(lcsc_id: str) -> dict:
     """Fetch EasyEDA preview SVGs for a part.
@@ -49,7 +92,9 @@ def fetch_easyeda_svgs(lcsc_id: str) -> dict:
 def convert_to_kicad(comp: dict, tmp_dir: str) -> dict:
     """Convert component data to KiCad files.
 
-    Returns dict with file paths, sanitized name, and metadata.
+    Returns dict with file paths, sanitized name, and metadata, plus the
+    footprint text ('fp_content'), decoded dataStr ('fp_data'), and parsed
+    footprint ('footprint_obj', 'footprint_origin') for the render steps.
     """
     title = comp.get("title", comp["lcsc_id"])
     name = sanitize_name(title)
@@ -66,6 +111,11 @@ def convert_to_kicad(comp: dict, tmp_dir: str) -> dict:
         "description": comp.get("description", ""),
         "sym_file": None,
         "fp_file": None,
+        "fp_content": None,
+        "fp_data": None,
+        "footprint_obj": None,
+        "footprint_origin": (0, 0),
+        "uuid_3d": "",
     }
 
     # Symbol
@@ -74,7 +124,7 @@ def convert_to_kicad(comp: dict, tmp_dir: str) -> dict:
         sym_data = sym_list[0]
         ds = sym_data.get("dataStr", {})
         if isinstance(ds, str):
-            ds = json.loads(ds)
+            ds = _cache.json_loads(ds)
         shapes = ds.get("shape", [])
         head = ds.get("head", {})
         origin_x = head.get("x", 0)
@@ -98,13 +148,16 @@ def convert_to_kicad(comp: dict, tmp_dir: str) -> dict:
     if fp_data:
         ds = fp_data.get("dataStr", {})
         if isinstance(ds, str):
-            ds = json.loads(ds)
+            ds = _cache.json_loads(ds)
         shapes = ds.get("shape", [])
         head = ds.get("head", {})
         origin_x = head.get("x", 0)
         origin_y = head.get("y", 0)
         if shapes:
             footprint = parse_footprint_shapes(shapes, origin_x, origin_y)
+            result["footprint_obj"] = footprint
+            result["footprint_origin"] = (origin_x, origin_y)
+            result["uuid_3d"] = footprint.model.uuid if footprint.model else ""
             fp_content = write_footprint(footprint, title)
             # kicad-cli requires .kicad_mod inside a .pretty directory
             pretty_dir = Path(tmp_dir) / f"{lcsc_id}.pretty"
@@ -112,18 +165,23 @@ def convert_to_kicad(comp: dict, tmp_dir: str) -> dict:
             fp_file = pretty_dir / f"{name}.kicad_mod"
             fp_file.write_text(fp_content)
             result["fp_file"] = str(fp_file)
+            result["fp_content"] = fp_content
             result["pretty_dir"] = str(pretty_dir)
+        result["fp_data"] = ds
 
     return result
 
 
+# The SVG export and both 3D views build a PCB from the same footprint,
+# so the bounds of recent footprints are kept
+@lru_cache(maxsize=64)
 def _estimate_footprint_bounds(footprint_content: str) -> tuple:
     """Estimate footprint bounding box from coordinate values in the content.
 
     Returns (min_x, min_y, max_x, max_y) or None if no coordinates found.
     """
     # Find all coordinate patterns: (at x y), (start x y), (end x y), (xy x y)
-    coords = re.findall(r"\((?:at|start|end|xy)\s+([-\d.]+)\s+([-\d.]+)", footprint_content)
+    coords = _COORD_RE.findall(footprint_content)
     if not coords:
         return None
     xs = [float(c[0]) for c in coords]
@@ -152,50 +210,24 @@ def _create_minimal_pcb(footprint_content: str) -> str:
             f'(layer "Edge.Cuts") (stroke (width 0.1) (type solid)))\n'
         )
 
-    pcb_header = """\
-(kicad_pcb
-  (version 20240108)
-  (generator "kicad_jlcimport")
-  (general
-    (thickness 1.6)
-    (legacy_teardrops no)
-  )
-  (paper "A4")
-  (layers
-    (0 "F.Cu" signal)
-    (31 "B.Cu" signal)
-    (36 "B.SilkS" user "B.Silkscreen")
-    (37 "F.SilkS" user "F.Silkscreen")
-    (38 "B.Mask" user)
-    (39 "F.Mask" user)
-    (44 "Edge.Cuts" user)
-    (46 "B.CrtYd" user "B.Courtyard")
-    (47 "F.CrtYd" user "F.Courtyard")
-    (48 "B.Fab" user)
-    (49 "F.Fab" user)
-  )
-  (setup
-    (pad_to_mask_clearance 0.05)
-  )
-  (net 0 "")
-"""
     # Inject (at 0 0 0) into the footprint to make it a placed footprint
-    # This ensures kicad-cli renders it the same as the interactive viewer
-    footprint_with_at = footprint_content.replace('(footprint "', '(footprint "', 1)
+    # This ensures kicad-cli renders it the same as the interactive viewer.
     # Find the first line break after (footprint and insert (at 0 0 0)
-    import re
+    footprint_with_at = _FOOTPRINT_HEAD_RE.sub(r"\1  (at 0 0 0)\n", footprint_content, count=1)
 
-    footprint_with_at = re.sub(r'(\(footprint "[^"]*"\s*\n)', r"\1  (at 0 0 0)\n", footprint_content, count=1)
-
-    return pcb_header + edge_cuts + footprint_with_at + "\n)"
+    return "".join((_PCB_HEADER, edge_cuts, footprint_with_at, "\n)"))
 
 
 def render_kicad_svgs(kicad_files: dict, tmp_dir: str) -> dict:
     """Render KiCad files to SVG using kicad-cli.
 
+    The symbol and footprint exports are independent, so both kicad-cli
+    processes are started before waiting on either.
+
     Returns dict with 'symbol_svg' and 'footprint_svg' strings (or None).
     """
     result = {"symbol_svg": None, "footprint_svg": None}
+    sym_proc = fp_proc = None
 
     # Symbol SVG — kicad-cli sym export matches by the internal symbol name
     # (the raw title stored inside the .kicad_sym file).
@@ -213,13 +245,7 @@ def render_kicad_svgs(kicad_files: dict, tmp_dir: str) -> dict:
             str(sym_svg_dir),
             kicad_files["sym_file"],
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-        if proc.returncode == 0:
-            svg_files = list(sym_svg_dir.glob("*.svg"))
-            if svg_files:
-                result["symbol_svg"] = svg_files[0].read_text()
-        if not result["symbol_svg"]:
-            print(f"  Warning: kicad-cli sym export failed: {proc.stderr.strip()}")
+        sym_proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
 
     # Footprint SVG — use pcb export instead of fp export to get drill holes rendered.
     # We create a minimal .kicad_pcb containing the footprint and export that.
@@ -228,8 +254,7 @@ def render_kicad_svgs(kicad_files: dict, tmp_dir: str) -> dict:
         fp_svg_dir.mkdir(exist_ok=True)
 
         # Create minimal PCB file with the footprint embedded
-        fp_content = Path(kicad_files["fp_file"]).read_text()
-        pcb_content = _create_minimal_pcb(fp_content)
+        pcb_content = _create_minimal_pcb(kicad_files["fp_content"])
         pcb_file = Path(tmp_dir) / "footprint.kicad_pcb"
         pcb_file.write_text(pcb_content)
 
@@ -252,26 +277,31 @@ def render_kicad_svgs(kicad_files: dict, tmp_dir: str) -> dict:
             str(svg_output),
             str(pcb_file),
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-        if proc.returncode == 0 and svg_output.exists():
+        fp_proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+    if sym_proc:
+        _, stderr = sym_proc.communicate()
+        if sym_proc.returncode == 0:
+            svg_files = list(sym_svg_dir.glob("*.svg"))
+            if svg_files:
+                result["symbol_svg"] = svg_files[0].read_text()
+        if not result["symbol_svg"]:
+            print(f"  Warning: kicad-cli sym export failed: {stderr.strip()}")
+
+    if fp_proc:
+        _, stderr = fp_proc.communicate()
+        if fp_proc.returncode == 0 and svg_output.exists():
             svg_content = svg_output.read_text()
             result["footprint_svg"] = _add_board_background(svg_content)
         if not result["footprint_svg"]:
-            print(f"  Warning: kicad-cli pcb export failed: {proc.stderr.strip()}")
+            print(f"  Warning: kicad-cli pcb export failed: {stderr.strip()}")
 
     return result
 
 
-def clean_svg_for_inline(svg: str) -> str:
-    """Strip XML declaration and DOCTYPE (invalid in inline HTML5)."""
-    svg = re.sub(r"<\?xml[^?]*\?>", "", svg)
-    svg = re.sub(r"<!DOCTYPE[^>]*>", "", svg)
-    return svg.lstrip()
-
-
 def _add_board_background(svg: str, color: str = "#001023") -> str:
     """Add a dark board background rect to the SVG based on its viewBox."""
-    match = re.search(r'viewBox="([^"]+)"', svg)
+    match = _VIEWBOX_RE.search(svg)
     if not match:
         return svg
     parts = match.group(1).split()
@@ -281,10 +311,14 @@ def _add_board_background(svg: str, color: str = "#001023") -> str:
     bg_rect = f'<rect x="{x}" y="{y}" width="{w}" height="{h}" fill="{color}"/>'
     # Insert after </desc> if present, otherwise after opening <svg> tag
     if "</desc>" in svg:
-        svg = re.sub(r"(</desc>)", rf"\1\n{bg_rect}", svg, count=1)
-    else:
-        svg = re.sub(r"(<svg[^>]*>)", rf"\1\n{bg_rect}", svg, count=1)
-    return svg
+        return svg.replace("</desc>", f"</desc>\n{bg_rect}", 1)
+    start = svg.find("<svg")
+    if start == -1:
+        return svg
+    end = svg.find(">", start) + 1
+    if end == 0:
+        return svg
+    return f"{svg[:end]}\n{bg_rect}{svg[end:]}"
 
 
 def render_3d_model(
@@ -305,7 +339,7 @@ def render_3d_model(
         model_rotation: (x, y, z) rotation tuple
         view: View type - "top", "bottom", or "oblique" (default)
 
-    Returns base64-encoded PNG data or None if rendering fails.
+    Returns the path of the rendered PNG, or None if rendering fails.
     """
     try:
         # Parse footprint to inject 3D model reference
@@ -362,15 +396,10 @@ def render_3d_model(
             "--zoom",
             "1.2",
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True)
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
 
         if proc.returncode == 0 and png_output.exists():
-            # Read PNG and convert to base64 data URI
-            import base64
-
-            png_data = png_output.read_bytes()
-            b64_data = base64.b64encode(png_data).decode("utf-8")
-            return f"data:image/png;base64,{b64_data}"
+            return str(png_output)
         else:
             print(f"  Warning: 3D render ({view}) failed: {proc.stderr.strip()}")
             return None
@@ -379,254 +408,306 @@ def render_3d_model(
         return None
 
 
-def generate_html(parts: list) -> str:
-    """Build an HTML comparison page for all parts."""
-    rows = []
+def _write_assets(parts: list, html_dir: str, out_dir: Optional[Path] = None) -> None:
+    """Write each part's SVGs to files and turn all render results into links.
+
+    Afterwards every SVG and 3D render value in *parts* is a path relative
+    to the HTML page. Linking the files instead of inlining them keeps the
+    page small, and the browser only decodes the rows scrolled into view.
+    SVGs go to *out_dir* (or *html_dir*). With *out_dir*, the 3D PNGs are
+    copied there too, so the output directory is self-contained.
+    """
+    asset_dir = out_dir if out_dir is not None else Path(html_dir)
     for part in parts:
-        meta = part["metadata"]
-        easyeda = part["easyeda_svgs"]
-        kicad = part["kicad_svgs"]
-
-        # Metadata header
-        meta_parts = [f"LCSC: {html.escape(meta['lcsc_id'])}"]
-        if meta.get("prefix"):
-            meta_parts.append(f"Prefix: {html.escape(meta['prefix'])}")
-        if meta.get("manufacturer"):
-            meta_parts.append(f"Mfr: {html.escape(meta['manufacturer'])}")
-        if meta.get("manufacturer_part"):
-            meta_parts.append(html.escape(meta["manufacturer_part"]))
-        datasheet_link = ""
-        if meta.get("datasheet"):
-            ds_url = html.escape(meta["datasheet"])
-            datasheet_link = f' | <a href="{ds_url}" target="_blank">Datasheet</a>'
-
-        title_text = html.escape(meta.get("title", meta["lcsc_id"]))
-        meta_line = " | ".join(meta_parts) + datasheet_link
-
-        # SVG cells
-        def svg_cell(svg, label):
-            if svg:
-                cleaned = clean_svg_for_inline(svg)
-                inner = (
-                    "<html><head><style>"
-                    "body{margin:0;display:flex;align-items:center;"
-                    "justify-content:center;width:100vw;height:100vh;overflow:hidden}"
-                    "svg{width:100%;height:100%;}"
-                    "</style></head><body>"
-                    f"{cleaned}</body></html>"
-                )
-                srcdoc = html.escape(inner, quote=True)
-                return (
-                    f'<div class="svg-cell">'
-                    f'<iframe srcdoc="{srcdoc}" '
-                    f'style="width:100%;aspect-ratio:1;border:none;" '
-                    f'scrolling="no"></iframe></div>'
-                )
-            return f'<div class="svg-cell empty">{html.escape(label)}</div>'
-
-        symbol_row = (
-            f'<div class="compare-row">'
-            f'<div class="row-label">Symbol</div>'
-            f'<div class="row-pair">'
-            f'<div class="col"><div class="col-label">EasyEDA</div>'
-            f"{svg_cell(easyeda.get('symbol_svg'), 'No SVG')}</div>"
-            f'<div class="col"><div class="col-label">KiCad</div>'
-            f"{svg_cell(kicad.get('symbol_svg'), 'Render failed')}</div>"
-            f"</div></div>"
-        )
+        if part.get("_cached"):
+            continue  # already links into out_dir
+        lcsc_id = part["metadata"]["lcsc_id"]
+        for source in ("easyeda", "kicad"):
+            svgs = part[f"{source}_svgs"]
+            for kind in ("symbol", "footprint"):
+                svg = svgs.get(f"{kind}_svg")
+                if svg:
+                    svg_path = asset_dir / f"{lcsc_id}_{source}_{kind}.svg"
+                    svg_path.write_text(svg, encoding="utf-8")
+                    svgs[f"{kind}_svg"] = Path(os.path.relpath(svg_path, html_dir)).as_posix()
+
+        model_3d = part["kicad_svgs"].get("model_3d")
+        if not model_3d:
+            continue
+        for view, png_path in model_3d.items():
+            if out_dir is not None:
+                dest = out_dir / f"{lcsc_id}_{view}.png"
+                shutil.copyfile(png_path, dest)
+                png_path = str(dest)
+            model_3d[view] = Path(os.path.relpath(png_path, html_dir)).as_posix()
+
+
+def _load_cached_part(out_dir: Path, lcsc_id: str) -> Optional[dict]:
+    """Return the result a previous ``--output-dir`` run saved for *lcsc_id*.
+
+    Returns None when there is no manifest or any file it links to is
+    missing, so the part gets converted and rendered again.
+    """
+    try:
+        part = json.loads((out_dir / f"{lcsc_id}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    links = [
+        link
+        for source in ("easyeda", "kicad")
+        for key, link in part[f"{source}_svgs"].items()
+        if key.endswith("_svg") and link
+    ]
+    links.extend((part["kicad_svgs"].get("model_3d") or {}).values())
+    if not all((out_dir / link).is_file() for link in links):
+        return None
+    part["_cached"] = True
+    return part
 
-        footprint_row = (
-            f'<div class="compare-row">'
-            f'<div class="row-label">Footprint</div>'
-            f'<div class="row-pair">'
-            f'<div class="col"><div class="col-label">EasyEDA</div>'
-            f"{svg_cell(easyeda.get('footprint_svg'), 'No SVG')}</div>"
-            f'<div class="col"><div class="col-label">KiCad</div>'
-            f"{svg_cell(kicad.get('footprint_svg'), 'Render failed')}</div>"
-            f"</div></div>"
-        )
 
-        # 3D Model row (top and bottom views)
-        model_3d = kicad.get("model_3d")
-        model_row = ""
-        if model_3d and isinstance(model_3d, dict):
-            model_top = model_3d.get("top")
-            model_bottom = model_3d.get("bottom")
-            if model_top and model_bottom:
-                model_row = (
-                    f'<div class="compare-row">'
-                    f'<div class="row-label">3D Model</div>'
-                    f'<div class="row-pair">'
-                    f'<div class="col"><div class="col-label">Top View</div>'
-                    f'<div class="svg-cell"><img src="{model_top}" style="width:100%;height:auto;" alt="3D Model Top"></div></div>'
-                    f'<div class="col"><div class="col-label">Bottom View</div>'
-                    f'<div class="svg-cell"><img src="{model_bottom}" style="width:100%;height:auto;" alt="3D Model Bottom"></div></div>'
-                    f"</div></div>"
-                )
-
-        rows.append(
-            f'<div class="part">'
-            f"<h2>{title_text}</h2>"
-            f'<div class="meta">{meta_line}</div>'
-            f"{symbol_row}{footprint_row}{model_row}"
-            f"</div>"
-        )
+def _save_part_manifest(out_dir: Path, part: dict) -> None:
+    """Record a rendered part's metadata and asset links for later runs."""
+    data = {key: value for key, value in part.items() if not key.startswith("_")}
+    path = out_dir / f"{part['metadata']['lcsc_id']}.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
 
-    parts_html = "\n".join(rows)
 
-    return f"""<!DOCTYPE html>
+_HTML_HEAD = """<!DOCTYPE html>
 <html>
 <head>
 <meta charset="utf-8">
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <title>EasyEDA vs KiCad Comparison</title>
 <style>
-  body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-         margin: 1em; background: #f5f5f5; color: #222; }}
-  .part {{ background: #fff; border-radius: 8px; padding: 1em; margin-bottom: 1.5em;
-           box-shadow: 0 1px 3px rgba(0,0,0,0.12);
-           content-visibility: auto; contain-intrinsic-size: auto none; }}
-  h2 {{ margin: 0 0 0.3em; font-size: 1.2em; }}
-  .meta {{ color: #666; margin-bottom: 1em; font-size: 0.85em; }}
-  .meta a {{ color: #0066cc; }}
-  .compare-row {{ margin-bottom: 1.5em; }}
-  .row-label {{ font-weight: 600; font-size: 1.1em; margin-bottom: 0.5em; }}
-  .row-pair {{ display: flex; gap: 1em; }}
-  .col {{ flex: 1; min-width: 0; }}
-  .col-label {{ text-align: center; font-size: 0.85em; color: #888;
-                margin-bottom: 0.3em; text-transform: uppercase; letter-spacing: 0.05em; }}
-  .svg-cell {{ border: 1px solid #ddd; border-radius: 4px; padding: 0.5em;
-               text-align: center; min-height: 100px; background: #fafafa;
-               display: flex; align-items: center; justify-content: center; }}
-  .svg-cell.empty {{ color: #999; font-style: italic; }}
-  @media (max-width: 600px) {{
-    .row-pair {{ flex-direction: column; }}
-  }}
+  body { font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+        margin: 1em; background: #f5f5f5; color: #222; }
+  .part { background: #fff; border-radius: 8px; padding: 1em; margin-bottom: 1.5em;
+          box-shadow: 0 1px 3px rgba(0,0,0,0.12);
+          content-visibility: auto; contain-intrinsic-size: auto none; }
+  h2 { margin: 0 0 0.3em; font-size: 1.2em; }
+  .meta { color: #666; margin-bottom: 1em; font-size: 0.85em; }
+  .meta a { color: #0066cc; }
+  .compare-row { margin-bottom: 1.5em; }
+  .row-label { font-weight: 600; font-size: 1.1em; margin-bottom: 0.5em; }
+  .row-pair { display: flex; gap: 1em; }
+  .col { flex: 1; min-width: 0; }
+  .col-label { text-align: center; font-size: 0.85em; color: #888;
+               margin-bottom: 0.3em; text-transform: uppercase; letter-spacing: 0.05em; }
+  .svg-cell { border: 1px solid #ddd; border-radius: 4px; padding: 0.5em;
+              text-align: center; min-height: 100px; background: #fafafa;
+              display: flex; align-items: center; justify-content: center; }
+  .svg-cell.empty { color: #999; font-style: italic; }
+  @media (max-width: 600px) {
+    .row-pair { flex-direction: column; }
+  }
 </style>
 </head>
 <body>
 <h1>EasyEDA vs KiCad Comparison</h1>
-{parts_html}
-</body>
-</html>"""
+"""
+
+_HTML_TAIL = "\n</body>\n</html>"
+
+
+def _render_part(part: dict) -> str:
+    """Build the HTML block for one part."""
+    meta = part["metadata"]
+    easyeda = part["easyeda_svgs"]
+    kicad = part["kicad_svgs"]
+
+    # Metadata header
+    meta_parts = [f"LCSC: {html.escape(meta['lcsc_id'])}"]
+    if meta.get("prefix"):
+        meta_parts.append(f"Prefix: {html.escape(meta['prefix'])}")
+    if meta.get("manufacturer"):
+        meta_parts.append(f"Mfr: {html.escape(meta['manufacturer'])}")
+    if meta.get("manufacturer_part"):
+        meta_parts.append(html.escape(meta["manufacturer_part"]))
+    datasheet_link = ""
+    if meta.get("datasheet"):
+        ds_url = html.escape(meta["datasheet"])
+        datasheet_link = f' | <a href="{ds_url}" target="_blank">Datasheet</a>'
+
+    title_text = html.escape(meta.get("title", meta["lcsc_id"]))
+    meta_line = " | ".join(meta_parts) + datasheet_link
+
+    # SVG cells
+    def svg_cell(svg_src, label):
+        if svg_src:
+            return (
+                f'<div class="svg-cell">'
+                f'<img src="{html.escape(svg_src, quote=True)}" loading="lazy" '
+                f'style="width:100%;aspect-ratio:1;object-fit:contain;" alt=""></div>'
+            )
+        return f'<div class="svg-cell empty">{html.escape(label)}</div>'
+
+    symbol_row = (
+        f'<div class="compare-row">'
+        f'<div class="row-label">Symbol</div>'
+        f'<div class="row-pair">'
+        f'<div class="col"><div class="col-label">EasyEDA</div>'
+        f"{svg_cell(easyeda.get('symbol_svg'), 'No SVG')}</div>"
+        f'<div class="col"><div class="col-label">KiCad</div>'
+        f"{svg_cell(kicad.get('symbol_svg'), 'Render failed')}</div>"
+        f"</div></div>"
+    )
+
+    footprint_row = (
+        f'<div class="compare-row">'
+        f'<div class="row-label">Footprint</div>'
+        f'<div class="row-pair">'
+        f'<div class="col"><div class="col-label">EasyEDA</div>'
+        f"{svg_cell(easyeda.get('footprint_svg'), 'No SVG')}</div>"
+        f'<div class="col"><div class="col-label">KiCad</div>'
+        f"{svg_cell(kicad.get('footprint_svg'), 'Render failed')}</div>"
+        f"</div></div>"
+    )
+
+    # 3D Model row (top and bottom views)
+    model_3d = kicad.get("model_3d")
+    model_row = ""
+    if model_3d and isinstance(model_3d, dict):
+        model_top = html.escape(model_3d.get("top") or "", quote=True)
+        model_bottom = html.escape(model_3d.get("bottom") or "", quote=True)
+        if model_top and model_bottom:
+            model_row = (
+                f'<div class="compare-row">'
+                f'<div class="row-label">3D Model</div>'
+                f'<div class="row-pair">'
+                f'<div class="col"><div class="col-label">Top View</div>'
+                f'<div class="svg-cell"><img src="{model_top}" loading="lazy" style="width:100%;height:auto;" alt="3D Model Top"></div></div>'
+                f'<div class="col"><div class="col-label">Bottom View</div>'
+                f'<div class="svg-cell"><img src="{model_bottom}" loading="lazy" style="width:100%;height:auto;" alt="3D Model Bottom"></div></div>'
+                f"</div></div>"
+            )
+
+    return (
+        f'<div class="part">'
+        f"<h2>{title_text}</h2>"
+        f'<div class="meta">{meta_line}</div>'
+        f"{symbol_row}{footprint_row}{model_row}"
+        f"</div>"
+    )
+
+
+def write_html(parts: list, out) -> None:
+    """Write the HTML comparison page for all parts to the text stream *out*.
+
+    Parts are rendered and written one at a time, so the full page is never
+    held in memory.
+    """
+    out.write(_HTML_HEAD)
+    for i, part in enumerate(parts):
+        if i:
+            out.write("\n")
+        out.write(_render_part(part))
+    out.write(_HTML_TAIL)
 
 
 def compare_part(lcsc_id: str, tmp_dir: str, verbose: bool = False) -> dict:
-    """Fetch, convert, and render a single part for comparison."""
+    """Fetch, convert, and render a single part for comparison.
+
+    With *verbose*, progress lines are buffered in the result's ``_log``
+    list rather than printed, so parts running on parallel workers don't
+    interleave their output.
+    """
     start_time = time.time()
-    if verbose:
-        print(f"\n--- {lcsc_id} ---")
+    log_lines = []
+
+    def log(msg):
+        if verbose:
+            log_lines.append(msg)
+
+    log(f"\n--- {lcsc_id} ---")
 
     # Fetch EasyEDA preview SVGs
-    if verbose:
-        print("  Fetching EasyEDA SVGs...")
+    log("  Fetching EasyEDA SVGs...")
     try:
         easyeda_svgs = fetch_easyeda_svgs(lcsc_id)
     except Exception as e:
-        if verbose:
-            print(f"  Error fetching EasyEDA SVGs: {e}")
+        log(f"  Error fetching EasyEDA SVGs: {e}")
         easyeda_svgs = {"symbol_svg": None, "footprint_svg": None}
 
     # Fetch full component and convert to KiCad
-    if verbose:
-        print("  Fetching component data...")
+    log("  Fetching component data...")
     try:
         comp = fetch_full_component(lcsc_id)
     except Exception as e:
-        if verbose:
-            print(f"  Error fetching component: {e}")
+        log(f"  Error fetching component: {e}")
         return {
             "metadata": {"lcsc_id": lcsc_id, "title": lcsc_id},
             "easyeda_svgs": easyeda_svgs,
             "kicad_svgs": {"symbol_svg": None, "footprint_svg": None},
+            "_log": log_lines,
         }
 
     part_dir = os.path.join(tmp_dir, lcsc_id)
     os.makedirs(part_dir, exist_ok=True)
 
-    if verbose:
-        print("  Converting to KiCad...")
+    log("  Converting to KiCad...")
     kicad_files = convert_to_kicad(comp, part_dir)
 
-    # Render KiCad SVGs
-    if verbose:
-        print("  Rendering KiCad SVGs...")
-    kicad_svgs = render_kicad_svgs(kicad_files, part_dir)
+    # Render KiCad SVGs. kicad-cli runs dominate the per-part time, so the
+    # exports run in the background while the 3D model is fetched, and the
+    # two 3D views render side by side.
+    log("  Rendering KiCad SVGs...")
+    render_pool = ThreadPoolExecutor(max_workers=3)
+    svg_future = render_pool.submit(render_kicad_svgs, kicad_files, part_dir)
 
     # Render 3D model if available
-    if verbose:
-        print("  Checking for 3D model...")
+    log("  Checking for 3D model...")
     model_3d = None
     try:
-        # Get uuid_3d from parsed footprint (same as importer does)
-        # The parser extracts uuid from SVGNODE shapes
-        fp_data = comp.get("footprint_data", {})
-        if fp_data:
-            ds = fp_data.get("dataStr", {})
-            if isinstance(ds, str):
-                ds = json.loads(ds)
-            shapes = ds.get("shape", [])
-            origin_x = ds.get("head", {}).get("x", 0)
-            origin_y = ds.get("head", {}).get("y", 0)
-
-            # Parse footprint to get the model UUID
-            footprint = parse_footprint_shapes(shapes, origin_x, origin_y)
-            uuid_3d = footprint.model.uuid if footprint.model else ""
-
-            if uuid_3d:
-                if verbose:
-                    print(f"  Found 3D model: {uuid_3d}")
-                # Download OBJ source
-                obj_source = download_wrl_source(uuid_3d)
-                if obj_source:
-                    if verbose:
-                        print("  Converting to VRML...")
-                    vrml_content = convert_to_vrml(obj_source)
-                    if vrml_content:
-                        # Save VRML file
-                        vrml_path = Path(part_dir) / "model.wrl"
-                        vrml_path.write_text(vrml_content)
-
-                        # Compute model transform (same as importer)
-                        if verbose:
-                            print("  Computing 3D model offsets...")
-                        model_offset, model_rotation = compute_model_transform(
-                            footprint.model, origin_x, origin_y, obj_source
-                        )
-                        if verbose:
-                            print(f"    Offset: ({model_offset[0]:.3f}, {model_offset[1]:.3f}, {model_offset[2]:.3f})")
-
-                        # Render 3D model (top and bottom views)
-                        if kicad_files.get("fp_file"):
-                            if verbose:
-                                print("  Rendering 3D snapshots (top and bottom views)...")
-                            fp_content = Path(kicad_files["fp_file"]).read_text()
-                            model_3d_top = render_3d_model(
-                                fp_content, str(vrml_path), part_dir, model_offset, model_rotation, "top"
-                            )
-                            model_3d_bottom = render_3d_model(
-                                fp_content, str(vrml_path), part_dir, model_offset, model_rotation, "bottom"
-                            )
-                            if model_3d_top and model_3d_bottom:
-                                model_3d = {"top": model_3d_top, "bottom": model_3d_bottom}
-                                if verbose:
-                                    print("  3D models rendered successfully")
-                            else:
-                                if verbose:
-                                    print("  Warning: Some 3D renders failed")
-                    else:
-                        if verbose:
-                            print("  Warning: VRML conversion failed")
+        # convert_to_kicad already read the model UUID from the parsed
+        # footprint, so parts without a model skip the 3D work entirely
+        uuid_3d = kicad_files["uuid_3d"]
+        if uuid_3d:
+            log(f"  Found 3D model: {uuid_3d}")
+            # Reuse the footprint convert_to_kicad already parsed
+            footprint = kicad_files["footprint_obj"]
+            origin_x, origin_y = kicad_files["footprint_origin"]
+            # Download OBJ source
+            obj_source = download_wrl_source(uuid_3d)
+            if obj_source:
+                log("  Converting to VRML...")
+                vrml_content = convert_to_vrml(obj_source)
+                if vrml_content:
+                    # Save VRML file
+                    vrml_path = Path(part_dir) / "model.wrl"
+                    vrml_path.write_text(vrml_content)
+
+                    # Compute model transform (same as importer)
+                    log("  Computing 3D model offsets...")
+                    model_offset, model_rotation = compute_model_transform(
+                        footprint.model, origin_x, origin_y, obj_source
+                    )
+                    log(f"    Offset: ({model_offset[0]:.3f}, {model_offset[1]:.3f}, {model_offset[2]:.3f})")
+
+                    # Render 3D model (top and bottom views)
+                    if kicad_files.get("fp_file"):
+                        log("  Rendering 3D snapshots (top and bottom views)...")
+                        fp_content = kicad_files["fp_content"]
+                        render_args = (fp_content, str(vrml_path), part_dir, model_offset, model_rotation)
+                        top_future = render_pool.submit(render_3d_model, *render_args, "top")
+                        bottom_future = render_pool.submit(render_3d_model, *render_args, "bottom")
+                        model_3d_top = top_future.result()
+                        model_3d_bottom = bottom_future.result()
+                        if model_3d_top and model_3d_bottom:
+                            model_3d = {"top": model_3d_top, "bottom": model_3d_bottom}
+                            log("  3D models rendered successfully")
+                        else:
+                            log("  Warning: Some 3D renders failed")
                 else:
-                    if verbose:
-                        print("  Warning: Failed to download 3D model")
+                    log("  Warning: VRML conversion failed")
             else:
-                if verbose:
-                    print("  No 3D model found")
+                log("  Warning: Failed to download 3D model")
+        else:
+            log("  No 3D model found")
     except Exception as e:
-        if verbose:
-            print(f"  Error processing 3D model: {e}")
+        log(f"  Error processing 3D model: {e}")
 
+    kicad_svgs = svg_future.result()
+    render_pool.shutdown()
     kicad_svgs["model_3d"] = model_3d
 
     metadata = {
@@ -644,6 +725,7 @@ def compare_part(lcsc_id: str, tmp_dir: str, verbose: bool = False) -> dict:
         "easyeda_svgs": easyeda_svgs,
         "kicad_svgs": kicad_svgs,
         "_elapsed": elapsed,
+        "_log": log_lines,
     }
 
 
@@ -654,7 +736,10 @@ def main():
     parser.add_argument("--output-dir", help="Write HTML to this directory instead of a temp dir")
     parser.add_argument("--workers", type=int, default=20, help="Number of parallel workers (default: 20)")
     parser.add_argument("--verbose", action="store_true", help="Show detailed progress for each part")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the on-disk API response cache")
+    parser.add_argument("--force", action="store_true", help="Re-render parts that already have output in --output-dir")
     args = parser.parse_args()
+    _cache.set_enabled(not args.no_cache)
 
     # Check kicad-cli exists
     if not os.path.isfile(KICAD_CLI):
@@ -663,6 +748,14 @@ def main():
 
     tmp_dir = tempfile.mkdtemp(prefix="kicad_compare_")
     print(f"Working directory: {tmp_dir}")
+
+    if args.output_dir:
+        out_dir = Path(args.output_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        html_path = str(out_dir / "index.html")
+    else:
+        out_dir = None
+        html_path = os.path.join(tmp_dir, "comparison.html")
     print(f"Processing {len(args.part_ids)} parts with {args.workers} workers...")
 
     if len(args.part_ids) > args.workers:
@@ -673,16 +766,25 @@ def main():
     parts = [None] * len(args.part_ids)  # Preserve order
     overall_start = time.time()
 
+    # Reuse parts rendered by a previous run into the same output directory
+    completed = 0
+    if out_dir is not None and not args.force:
+        for idx, part_id in enumerate(args.part_ids):
+            parts[idx] = _load_cached_part(out_dir, part_id)
+            if parts[idx] is not None:
+                completed += 1
+                print(f"  [{completed}/{len(args.part_ids)}] {part_id} (cached)")
+
     with ThreadPoolExecutor(max_workers=args.workers) as executor:
         # Submit all jobs
         future_to_idx = {
             executor.submit(compare_part, part_id, tmp_dir, args.verbose): idx
             for idx, part_id in enumerate(args.part_ids)
+            if parts[idx] is None
         }
-        print(f"Started {len(args.part_ids)} jobs...")
+        print(f"Started {len(future_to_idx)} jobs...")
 
         # Collect results as they complete
-        completed = 0
         for future in as_completed(future_to_idx):
             idx = future_to_idx[future]
             part_id = args.part_ids[idx]
@@ -691,7 +793,9 @@ def main():
                 parts[idx] = result
                 completed += 1
                 elapsed = result.get("_elapsed", 0)
-                if not args.verbose:
+                if args.verbose:
+                    print("\n".join(result.get("_log", [])))
+                else:
                     print(f"  [{completed}/{len(args.part_ids)}] {part_id} ({elapsed:.1f}s)")
             except Exception as e:
                 print(f"  [{completed}/{len(args.part_ids)}] Error: {part_id}: {e}")
@@ -707,18 +811,16 @@ def main():
         f"\nCompleted {len(args.part_ids)} parts in {total_elapsed:.1f}s ({total_elapsed / len(args.part_ids):.1f}s avg)"
     )
 
-    # Generate HTML
-    html_content = generate_html(parts)
+    _write_assets(parts, os.path.dirname(html_path), out_dir)
+    if out_dir is not None:
+        for part in parts:
+            # Only parts that made it through the full pipeline carry _elapsed
+            if "_elapsed" in part:
+                _save_part_manifest(out_dir, part)
 
-    if args.output_dir:
-        out_dir = Path(args.output_dir)
-        out_dir.mkdir(parents=True, exist_ok=True)
-        html_path = str(out_dir / "index.html")
-    else:
-        html_path = os.path.join(tmp_dir, "comparison.html")
-
-    with open(html_path, "w") as f:
-        f.write(html_content)
+    # Generate HTML
+    with open(html_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        write_html(parts, f)
 
     print(f"\nHTML written to: {html_path}")
 
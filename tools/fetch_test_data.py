@@ -7,8 +7,14 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
+import _cache
+
 from kicad_jlcimport.easyeda.api import download_wrl_source, fetch_full_component
 
+# Part data is stable, so re-fetching the same parts skips the network
+fetch_full_component = _cache.disk_cache("full_component")(fetch_full_component)
+download_wrl_source = _cache.disk_cache("wrl_source")(download_wrl_source)
+
 
 def fetch_test_data(part_id: str, output_dir: Path):
     """Fetch and save symbol, footprint, and 3D model data."""
@@ -43,10 +49,8 @@ def fetch_test_data(part_id: str, output_dir: Path):
             if isinstance(shape, str) and shape.startswith("SVGNODE~"):
                 # Parse the JSON part after SVGNODE~
                 try:
-                    import json as json_mod
-
                     json_str = shape[8:]  # Remove "SVGNODE~" prefix
-                    svgnode_data = json_mod.loads(json_str)
+                    svgnode_data = _cache.json_loads(json_str)
                     uuid_3d = svgnode_data.get("attrs", {}).get("uuid", "")
                     if uuid_3d:
                         break
@@ -69,15 +73,18 @@ def fetch_test_data(part_id: str, output_dir: Path):
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print(f"Usage: {sys.argv[0]} <part_id> [part_id...]")
+    part_ids = [a for a in sys.argv[1:] if a != "--no-cache"]
+    _cache.set_enabled("--no-cache" not in sys.argv[1:])
+
+    if not part_ids:
+        print(f"Usage: {sys.argv[0]} [--no-cache] <part_id> [part_id...]")
         print(f"Example: {sys.argv[0]} C5213 C3794")
         sys.exit(1)
 
     testdata_dir = Path(__file__).resolve().parent.parent / "testdata"
     testdata_dir.mkdir(exist_ok=True)
 
-    for part_id in sys.argv[1:]:
+    for part_id in part_ids:
         try:
             fetch_test_data(part_id, testdata_dir)
         except Exception as e:
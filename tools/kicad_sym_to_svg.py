@@ -21,8 +21,8 @@ Colors:
 """
 
 import argparse
+import io
 import math
-import re
 import sys
 from pathlib import Path
 
@@ -30,8 +30,176 @@ from pathlib import Path
 DEFAULT_SCALE = 20  # Pixels per mm (KiCad uses mm)
 DEFAULT_PADDING = 40  # Padding around content in pixels
 
+# Node heads rendered by this tool; anything else is descended into
+_SHAPE_KINDS = ("rectangle", "polyline", "arc", "circle", "pin")
+_DELIMITERS = frozenset(" \t\r\n()")
 
-def _compute_bounding_box(content, scale):
+
+def _read_sexpr(content):
+    """Parse S-expression text into nested lists in a single pass.
+
+    Each ``(head arg ...)`` becomes ``[head, arg, ...]``; atoms and quoted
+    strings are kept as ``str``. Unbalanced closing parens are ignored.
+    """
+    root = []
+    stack = [root]
+    i = 0
+    n = len(content)
+    while i < n:
+        c = content[i]
+        if c == "(":
+            node = []
+            stack[-1].append(node)
+            stack.append(node)
+            i += 1
+        elif c == ")":
+            if len(stack) > 1:
+                stack.pop()
+            i += 1
+        elif c in _DELIMITERS:
+            i += 1
+        elif c == '"':
+            # Quoted string: scan to the closing quote, honouring backslash escapes
+            chars = []
+            i += 1
+            while i < n and content[i] != '"':
+                if content[i] == "\\" and i + 1 < n:
+                    i += 1
+                chars.append(content[i])
+                i += 1
+            stack[-1].append("".join(chars))
+            i += 1
+        else:
+            j = i + 1
+            while j < n and content[j] not in _DELIMITERS:
+                j += 1
+            stack[-1].append(content[i:j])
+            i = j
+    return root
+
+
+def _fmt(v):
+    """Format an SVG coordinate with at most 2 decimals, trailing zeros stripped.
+
+    Coordinates are in pixels, so hundredths are already below what any
+    renderer can show.
+    """
+    text = format(v, ".2f").rstrip("0").rstrip(".")
+    return "0" if text in ("", "-", "-0") else text
+
+
+def _find(node, head):
+    """Return the first child list of *node* whose head is *head*, or None."""
+    for child in node:
+        if isinstance(child, list) and child and child[0] == head:
+            return child
+    return None
+
+
+def _floats(node, head, count):
+    """Return the first *count* numeric args of child *head* as floats, or None."""
+    child = _find(node, head)
+    if child is None or len(child) < count + 1:
+        return None
+    try:
+        return [float(v) for v in child[1 : count + 1]]
+    except ValueError:
+        return None
+
+
+def _rectangle(node):
+    start = _floats(node, "start", 2)
+    end = _floats(node, "end", 2)
+    return (*start, *end) if start and end else None
+
+
+def _polyline(node):
+    pts = _find(node, "pts")
+    points = []
+    for xy in pts[1:] if pts else ():
+        if isinstance(xy, list) and len(xy) >= 3 and xy[0] == "xy":
+            points.append((float(xy[1]), float(xy[2])))
+    if not points:
+        return None
+    fill = _find(node, "fill")
+    fill_type = _find(fill, "type") if fill else None
+    return points, fill_type[1] if fill_type and len(fill_type) > 1 else "none"
+
+
+def _arc(node):
+    start = _floats(node, "start", 2)
+    mid = _floats(node, "mid", 2)
+    end = _floats(node, "end", 2)
+    return (*start, *mid, *end) if start and mid and end else None
+
+
+def _circle(node):
+    center = _floats(node, "center", 2)
+    radius = _floats(node, "radius", 1)
+    return (*center, *radius) if center and radius else None
+
+
+def _pin(node):
+    at = _find(node, "at")
+    length = _floats(node, "length", 1)
+    if not at or len(at) < 3 or not length:
+        return None
+    rotation = float(at[3]) if len(at) > 3 else 0.0
+    name = _find(node, "name")
+    number = _find(node, "number")
+    return (
+        float(at[1]),
+        float(at[2]),
+        rotation,
+        length[0],
+        name[1] if name and len(name) > 1 else None,
+        number[1] if number and len(number) > 1 else None,
+    )
+
+
+# Shape head -> extractor returning a coordinate tuple (or None if malformed)
+_EXTRACTORS = {
+    "rectangle": _rectangle,
+    "polyline": _polyline,
+    "arc": _arc,
+    "circle": _circle,
+    "pin": _pin,
+}
+
+
+def _collect_shapes(tree):
+    """Walk the parsed tree once and extract drawable shapes.
+
+    Returns ``(symbol_name, shapes)`` where *shapes* maps each kind in
+    ``_SHAPE_KINDS`` to a list of coordinate tuples in file order.
+    """
+    shapes = {kind: [] for kind in _SHAPE_KINDS}
+    symbol_name = None
+
+    stack = [iter(tree)]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            continue
+        if not isinstance(child, list) or not child:
+            continue
+        head = child[0]
+
+        extract = _EXTRACTORS.get(head)
+        if extract is not None:
+            shape = extract(child)
+            if shape is not None:
+                shapes[head].append(shape)
+            continue
+        if head == "symbol" and symbol_name is None and len(child) > 1:
+            symbol_name = child[1]
+        stack.append(iter(child[1:]))
+
+    return symbol_name, shapes
+
+
+def _compute_bounding_box(shapes):
     """Compute bounding box of all elements in KiCad coordinates."""
     min_x = min_y = float("inf")
     max_x = max_y = float("-inf")
@@ -44,33 +212,27 @@ def _compute_bounding_box(content, scale):
         max_y = max(max_y, y)
 
     # Rectangles
-    for m in re.finditer(r"\(rectangle \(start ([\d.-]+) ([\d.-]+)\) \(end ([\d.-]+) ([\d.-]+)\)", content):
-        extend(float(m.group(1)), float(m.group(2)))
-        extend(float(m.group(3)), float(m.group(4)))
+    for x1, y1, x2, y2 in shapes["rectangle"]:
+        extend(x1, y1)
+        extend(x2, y2)
 
     # Polylines
-    for m in re.finditer(r"\(polyline\s+\(pts\s+((?:\(xy[\s\d.-]+\)\s*)+)\)", content):
-        for px, py in re.findall(r"\(xy ([\d.-]+) ([\d.-]+)\)", m.group(1)):
-            extend(float(px), float(py))
+    for points, _fill_type in shapes["polyline"]:
+        for px, py in points:
+            extend(px, py)
 
     # Arcs
-    for m in re.finditer(
-        r"\(arc \(start ([\d.-]+) ([\d.-]+)\) \(mid ([\d.-]+) ([\d.-]+)\) \(end ([\d.-]+) ([\d.-]+)\)", content
-    ):
+    for arc in shapes["arc"]:
         for i in range(0, 6, 2):
-            extend(float(m.group(i + 1)), float(m.group(i + 2)))
+            extend(arc[i], arc[i + 1])
 
     # Circles
-    for m in re.finditer(r"\(circle \(center ([\d.-]+) ([\d.-]+)\) \(radius ([\d.-]+)\)", content):
-        cx, cy, r = float(m.group(1)), float(m.group(2)), float(m.group(3))
+    for cx, cy, r in shapes["circle"]:
         extend(cx - r, cy - r)
         extend(cx + r, cy + r)
 
     # Pins
-    for m in re.finditer(r"\(pin \w+ line \(at ([\d.-]+) ([\d.-]+) ([\d.-]+)\) \(length ([\d.-]+)\)", content):
-        px, py = float(m.group(1)), float(m.group(2))
-        rotation = float(m.group(3))
-        length = float(m.group(4))
+    for px, py, rotation, length, _name, _number in shapes["pin"]:
         extend(px, py)
         rad = math.radians(rotation)
         extend(px + length * math.cos(rad), py + length * math.sin(rad))
@@ -81,7 +243,7 @@ def _compute_bounding_box(content, scale):
     return min_x, min_y, max_x, max_y
 
 
-def parse_kicad_sym_to_svg(filepath, scale=DEFAULT_SCALE, width=None, height=None):
+def parse_kicad_sym_to_svg(filepath, scale=DEFAULT_SCALE, width=None, height=None, out=None):
     """Parse a .kicad_sym file and return SVG markup.
 
     Args:
@@ -89,15 +251,23 @@ def parse_kicad_sym_to_svg(filepath, scale=DEFAULT_SCALE, width=None, height=Non
         scale: Pixels per mm for scaling
         width: SVG canvas width in pixels (None = auto-fit)
         height: SVG canvas height in pixels (None = auto-fit)
+        out: Optional text file-like object; when given, SVG is written to it
+            shape by shape instead of being built in memory
 
     Returns:
-        SVG markup as a string
+        SVG markup as a string, or None when written to *out*
     """
-    with open(filepath) as f:
-        content = f.read()
+    # KiCad writes UTF-8; decode the whole file in one call rather than
+    # through a locale-dependent incremental text reader
+    with open(filepath, "rb") as f:
+        content = f.read().decode("utf-8")
+
+    symbol_name, shapes = _collect_shapes(_read_sexpr(content))
+    if symbol_name is None:
+        symbol_name = "Unknown"
 
     # Compute bounding box and auto-fit canvas
-    min_x, min_y, max_x, max_y = _compute_bounding_box(content, scale)
+    min_x, min_y, max_x, max_y = _compute_bounding_box(shapes)
     content_width = (max_x - min_x) * scale
     content_height = (max_y - min_y) * scale
 
@@ -112,97 +282,113 @@ def parse_kicad_sym_to_svg(filepath, scale=DEFAULT_SCALE, width=None, height=Non
     offset_x = width / 2 - center_x * scale
     offset_y = height / 2 + center_y * scale  # Flip Y
 
-    svg_elements = []
-
-    # Extract symbol name for the title
-    name_match = re.search(r'\(symbol "([^"]+)"', content)
-    symbol_name = name_match.group(1) if name_match else "Unknown"
+    to_string = out is None
+    if to_string:
+        out = io.StringIO()
+    emit = out.writelines
+    sep = "\n"
+
+    w = _fmt(width)
+    h = _fmt(height)
+    emit(
+        (
+            '<?xml version="1.0" encoding="UTF-8"?>\n<svg xmlns="http://www.w3.org/2000/svg" width="',
+            w,
+            '" height="',
+            h,
+            '" viewBox="0 0 ',
+            w,
+            " ",
+            h,
+            '">\n<rect width="100%" height="100%" fill="white"/>\n<text x="',
+            _fmt(width / 2),
+            '" y="15" text-anchor="middle" font-size="10" fill="black">',
+            symbol_name,
+            "</text>\n",
+        )
+    )
 
-    # --- Parse rectangles ---
+    # --- Rectangles ---
     # Format: (rectangle (start X1 Y1) (end X2 Y2) ...)
-    for m in re.finditer(r"\(rectangle \(start ([\d.-]+) ([\d.-]+)\) \(end ([\d.-]+) ([\d.-]+)\)", content):
-        x1, y1, x2, y2 = float(m.group(1)), float(m.group(2)), float(m.group(3)), float(m.group(4))
+    for x1, y1, x2, y2 in shapes["rectangle"]:
         # Convert to SVG coordinates (Y is flipped: KiCad Y+ is up, SVG Y+ is down)
         x1_svg = x1 * scale + offset_x
         y1_svg = -y1 * scale + offset_y
         x2_svg = x2 * scale + offset_x
         y2_svg = -y2 * scale + offset_y
         # SVG rect needs top-left corner and positive width/height
-        svg_elements.append(
-            f'<rect x="{min(x1_svg, x2_svg)}" y="{min(y1_svg, y2_svg)}" '
-            f'width="{abs(x2_svg - x1_svg)}" height="{abs(y2_svg - y1_svg)}" '
-            f'fill="none" stroke="darkgreen" stroke-width="2"/>'
+        emit(
+            (
+                '<rect x="',
+                _fmt(min(x1_svg, x2_svg)),
+                '" y="',
+                _fmt(min(y1_svg, y2_svg)),
+                '" width="',
+                _fmt(abs(x2_svg - x1_svg)),
+                '" height="',
+                _fmt(abs(y2_svg - y1_svg)),
+                '" fill="none" stroke="darkgreen" stroke-width="2"/>',
+                sep,
+            )
         )
 
-    # --- Parse polylines ---
+    # --- Polylines ---
     # Format: (polyline (pts ...) (stroke ...) (fill (type TYPE)))
-    for m in re.finditer(r"\(polyline\s+(.*?)\n\s*\)", content, re.DOTALL):
-        block = m.group(1)
-        pts_match = re.search(r"\(pts\s+((?:\(xy[\s\d.-]+\)\s*)+)\)", block)
-        if not pts_match:
-            continue
-        points = re.findall(r"\(xy ([\d.-]+) ([\d.-]+)\)", pts_match.group(1))
-        if not points:
-            continue
-        # Check fill type
-        fill_match = re.search(r"\(fill \(type (\w+)\)\)", block)
-        fill_type = fill_match.group(1) if fill_match else "none"
-        # Build SVG path
-        path_parts = []
+    for points, fill_type in shapes["polyline"]:
+        emit(('<path d="',))
         for i, (x, y) in enumerate(points):
-            x_svg = float(x) * scale + offset_x
-            y_svg = -float(y) * scale + offset_y  # Flip Y
-            cmd = "M" if i == 0 else "L"
-            path_parts.append(f"{cmd} {x_svg} {y_svg}")
-        path_d = " ".join(path_parts)
+            emit(("M" if i == 0 else "L", _fmt(x * scale + offset_x), " ", _fmt(-y * scale + offset_y)))
         # Fill with stroke color if fill type is "outline" or "background"
         fill_attr = "darkgreen" if fill_type in ("outline", "background") else "none"
-        svg_elements.append(f'<path d="{path_d}" fill="{fill_attr}" stroke="darkgreen" stroke-width="2"/>')
+        emit(('" fill="', fill_attr, '" stroke="darkgreen" stroke-width="2"/>', sep))
 
-    # --- Parse arcs ---
+    # --- Arcs ---
     # Format: (arc (start SX SY) (mid MX MY) (end EX EY) ...)
     # KiCad uses start/mid/end points; we use quadratic bezier with computed control point
-    for m in re.finditer(
-        r"\(arc \(start ([\d.-]+) ([\d.-]+)\) \(mid ([\d.-]+) ([\d.-]+)\) \(end ([\d.-]+) ([\d.-]+)\)", content
-    ):
-        sx, sy, mx, my, ex, ey = [float(g) for g in m.groups()]
-
+    for sx, sy, mx, my, ex, ey in shapes["arc"]:
         # For a quadratic bezier to pass through mid at t=0.5, the control point must be:
         # control = 2*mid - (start + end)/2
         ctrl_x = 2 * mx - (sx + ex) / 2
         ctrl_y = 2 * my - (sy + ey) / 2
 
-        # Convert to SVG coordinates
-        sx_svg = sx * scale + offset_x
-        sy_svg = -sy * scale + offset_y
-        ctrl_x_svg = ctrl_x * scale + offset_x
-        ctrl_y_svg = -ctrl_y * scale + offset_y
-        ex_svg = ex * scale + offset_x
-        ey_svg = -ey * scale + offset_y
-
-        svg_elements.append(
-            f'<path d="M {sx_svg} {sy_svg} Q {ctrl_x_svg} {ctrl_y_svg} {ex_svg} {ey_svg}" '
-            f'fill="none" stroke="darkgreen" stroke-width="2"/>'
+        emit(
+            (
+                '<path d="M',
+                _fmt(sx * scale + offset_x),
+                " ",
+                _fmt(-sy * scale + offset_y),
+                "Q",
+                _fmt(ctrl_x * scale + offset_x),
+                " ",
+                _fmt(-ctrl_y * scale + offset_y),
+                " ",
+                _fmt(ex * scale + offset_x),
+                " ",
+                _fmt(-ey * scale + offset_y),
+                '" fill="none" stroke="darkgreen" stroke-width="2"/>',
+                sep,
+            )
         )
 
-    # --- Parse circles ---
+    # --- Circles ---
     # Format: (circle (center CX CY) (radius R) ...)
-    for m in re.finditer(r"\(circle \(center ([\d.-]+) ([\d.-]+)\) \(radius ([\d.-]+)\)", content):
-        cx, cy, r = float(m.group(1)), float(m.group(2)), float(m.group(3))
-        cx_svg = cx * scale + offset_x
-        cy_svg = -cy * scale + offset_y
-        r_svg = r * scale
-        svg_elements.append(
-            f'<circle cx="{cx_svg}" cy="{cy_svg}" r="{r_svg}" fill="none" stroke="darkgreen" stroke-width="2"/>'
+    for cx, cy, r in shapes["circle"]:
+        emit(
+            (
+                '<circle cx="',
+                _fmt(cx * scale + offset_x),
+                '" cy="',
+                _fmt(-cy * scale + offset_y),
+                '" r="',
+                _fmt(r * scale),
+                '" fill="none" stroke="darkgreen" stroke-width="2"/>',
+                sep,
+            )
         )
 
-    # --- Parse pins ---
+    # --- Pins ---
     # Format: (pin TYPE STYLE (at X Y ROTATION) (length LEN) ... (number "N") ...)
-    for m in re.finditer(r"\(pin \w+ line \(at ([\d.-]+) ([\d.-]+) ([\d.-]+)\) \(length ([\d.-]+)\)", content):
-        px, py = float(m.group(1)), float(m.group(2))
-        rotation = float(m.group(3))  # Degrees
-        length = float(m.group(4))
-
+    for px, py, rotation, length, pin_name, pin_number in shapes["pin"]:
         # Pin origin (connection point) in SVG coords
         px_svg = px * scale + offset_x
         py_svg = -py * scale + offset_y
@@ -215,29 +401,31 @@ def parse_kicad_sym_to_svg(filepath, scale=DEFAULT_SCALE, width=None, height=Non
         end_x_svg = end_x * scale + offset_x
         end_y_svg = -end_y * scale + offset_y
 
-        # Draw pin line
-        svg_elements.append(
-            f'<line x1="{px_svg}" y1="{py_svg}" x2="{end_x_svg}" y2="{end_y_svg}" stroke="red" stroke-width="2"/>'
-        )
-        # Draw connection point (circle at pin origin)
-        svg_elements.append(f'<circle cx="{px_svg}" cy="{py_svg}" r="4" fill="red"/>')
-
-        # Find pin number and name
-        # Look for (name "N") and (number "N") after this pin's (at ...) clause
-        pin_match = re.search(
-            rf"\(pin \w+ line \(at {re.escape(m.group(1))} {re.escape(m.group(2))} "
-            rf'{re.escape(m.group(3))}\).*?\(name "([^"]+)".*?\(number "([^"]+)"',
-            content,
-            re.DOTALL,
-        )
-        if pin_match:
-            pin_name = pin_match.group(1)
-            pin_number = pin_match.group(2)
-            # Pin number near connection point
-            svg_elements.append(
-                f'<text x="{px_svg}" y="{py_svg - 10}" text-anchor="middle" '
-                f'font-size="10" fill="red">{pin_number}</text>'
+        px_s = _fmt(px_svg)
+        py_s = _fmt(py_svg)
+        # Draw pin line, then the connection point (circle at pin origin)
+        emit(
+            (
+                '<line x1="',
+                px_s,
+                '" y1="',
+                py_s,
+                '" x2="',
+                _fmt(end_x_svg),
+                '" y2="',
+                _fmt(end_y_svg),
+                '" stroke="red" stroke-width="2"/>',
+                sep,
+                '<circle cx="',
+                px_s,
+                '" cy="',
+                py_s,
+                '" r="4" fill="red"/>',
+                sep,
             )
+        )
+
+        if pin_name and pin_number:
             # Pin name near the end of pin (inside symbol body)
             # Position depends on pin rotation
             name_offset = 8  # pixels from pin end
@@ -253,19 +441,32 @@ def parse_kicad_sym_to_svg(filepath, scale=DEFAULT_SCALE, width=None, height=Non
             else:  # rotation == 270, pin extends down, name below end
                 name_x, name_y = end_x_svg, end_y_svg + name_offset + 8
                 anchor = "middle"
-            svg_elements.append(
-                f'<text x="{name_x}" y="{name_y}" text-anchor="{anchor}" '
-                f'font-size="10" fill="darkgreen">{pin_name}</text>'
+            # Pin number near connection point, pin name near the pin end
+            emit(
+                (
+                    '<text x="',
+                    px_s,
+                    '" y="',
+                    _fmt(py_svg - 10),
+                    '" text-anchor="middle" font-size="10" fill="red">',
+                    pin_number,
+                    "</text>",
+                    sep,
+                    '<text x="',
+                    _fmt(name_x),
+                    '" y="',
+                    _fmt(name_y),
+                    '" text-anchor="',
+                    anchor,
+                    '" font-size="10" fill="darkgreen">',
+                    pin_name,
+                    "</text>",
+                    sep,
+                )
             )
 
-    # Assemble final SVG
-    svg = f'''<?xml version="1.0" encoding="UTF-8"?>
-<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">
-  <rect width="100%" height="100%" fill="white"/>
-  <text x="{width / 2}" y="15" text-anchor="middle" font-size="10" fill="black">{symbol_name}</text>
-  {chr(10).join(svg_elements)}
-</svg>'''
-    return svg
+    out.write("</svg>")
+    return out.getvalue() if to_string else None
 
 
 def main():
@@ -278,13 +479,13 @@ def main():
 
     args = parser.parse_args()
 
-    svg = parse_kicad_sym_to_svg(args.input, args.scale, args.width, args.height)
-
     if args.output:
-        Path(args.output).write_text(svg)
+        with Path(args.output).open("w", encoding="utf-8") as out:
+            parse_kicad_sym_to_svg(args.input, args.scale, args.width, args.height, out=out)
         print(f"Wrote {args.output}", file=sys.stderr)
     else:
-        print(svg)
+        parse_kicad_sym_to_svg(args.input, args.scale, args.width, args.height, out=sys.stdout)
+        print()
 
 
 if __name__ == "__main__":
@@ -1,24 +1,47 @@
 #!/usr/bin/env python3
 """Test what happens if we apply z-offset heuristic to all parts with OBJ data."""
 
-import json
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
+import _cache
+
 from kicad_jlcimport.easyeda.parser import parse_footprint_shapes
 from kicad_jlcimport.kicad.model3d import _obj_bounding_box
 
 
-def analyze_with_new_logic(lcsc_id: str, testdata_dir: Path):
-    """Show what z-offset would be with new logic."""
-    fp_path = testdata_dir / f"{lcsc_id}_footprint.json"
-    if not fp_path.exists():
-        return None
+@dataclass(frozen=True)
+class AnalyzeResult:
+    has_obj: bool
+    z_min: float = 0.0
+    z_max: float = 0.0
+    extends_below: bool = False
+    z_offset_new: float = 0.0
+    z_offset_old: float = 0.0
+
+
+@lru_cache(maxsize=512)
+def _obj_z_range(obj_path: Path, mtime: float):
+    """Return (z_min, z_max) of an OBJ file's vertices from the library's _obj_bounding_box.
+
+    Results are memoized; *mtime* is part of the key so edited files are
+    parsed again.
+    """
+    with open(obj_path) as f:
+        _, _, z_min, z_max = _obj_bounding_box(f.read())
+    return z_min, z_max
 
-    with open(fp_path) as f:
-        fp_data = json.load(f)
+
+@lru_cache(maxsize=256)
+def _footprint_model_z(fp_path: Path) -> Optional[float]:
+    """Return the footprint's 3D model z (EasyEDA units), or None without a model."""
+    data = fp_path.read_bytes()
+    fp_data = _cache.json_loads(data)
 
     fp_head = fp_data["dataStr"]["head"]
     fp_origin_x = fp_head["x"]
@@ -26,17 +49,25 @@ def analyze_with_new_logic(lcsc_id: str, testdata_dir: Path):
     fp_shapes = fp_data["dataStr"]["shape"]
     footprint = parse_footprint_shapes(fp_shapes, fp_origin_x, fp_origin_y)
 
-    if not footprint.model:
+    return footprint.model.z if footprint.model else None
+
+
+def analyze_with_new_logic(lcsc_id: str, testdata_dir: Path) -> Optional[AnalyzeResult]:
+    """Show what z-offset would be with new logic."""
+    fp_path = testdata_dir / f"{lcsc_id}_footprint.json"
+    if not fp_path.exists():
         return None
 
+    # Without an OBJ there is nothing to compare, so skip parsing the footprint
     obj_path = testdata_dir / f"{lcsc_id}_model.obj"
     if not obj_path.exists():
-        return {"has_obj": False, "z_offset": 0.0}
+        return AnalyzeResult(has_obj=False)
 
-    with open(obj_path) as f:
-        obj_source = f.read()
+    model_z = _footprint_model_z(fp_path)
+    if model_z is None:
+        return None
 
-    cx, cy, z_min, z_max = _obj_bounding_box(obj_source)
+    z_min, z_max = _obj_z_range(obj_path, obj_path.stat().st_mtime)
 
     # NEW LOGIC: apply heuristic to all parts with OBJ data
     if z_max < abs(z_min):
@@ -44,14 +75,14 @@ def analyze_with_new_logic(lcsc_id: str, testdata_dir: Path):
     else:
         z_offset = -z_min / 2  # extends above
 
-    return {
-        "has_obj": True,
-        "z_min": z_min,
-        "z_max": z_max,
-        "extends_below": z_max < abs(z_min),
-        "z_offset_new": z_offset,
-        "z_offset_old": footprint.model.z / 100.0,
-    }
+    return AnalyzeResult(
+        has_obj=True,
+        z_min=z_min,
+        z_max=z_max,
+        extends_below=z_max < abs(z_min),
+        z_offset_new=z_offset,
+        z_offset_old=model_z / 100.0,
+    )
 
 
 if __name__ == "__main__":
@@ -71,9 +102,9 @@ if __name__ == "__main__":
 
     for part_id, expected_z in test_cases:
         result = analyze_with_new_logic(part_id, testdata_dir)
-        if result and result["has_obj"]:
-            old_z = result["z_offset_old"]
-            new_z = result["z_offset_new"]
+        if result and result.has_obj:
+            old_z = result.z_offset_old
+            new_z = result.z_offset_new
             # Check if new matches expected (within tolerance)
             matches = abs(new_z - expected_z) < 0.2
             print(f"{part_id:8} | {expected_z:8.3f} | {old_z:9.3f} | {new_z:9.3f} | {'✓' if matches else '✗'}")